@@ -3,106 +3,211 @@
 Comprehensive API Key Diagnostic Tool
 Identifies and fixes -2015 errors and IP restriction issues
 """
+import argparse
 import os
 import sys
 import time
 import hmac
-import hashlib
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from test_api_keys_advanced import PUBLIC_IP_TTL, read_cached_ip, write_cached_ip
 
-# Load environment variables
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
+
+# Load environment variables once; every probe reads these constants
 load_dotenv()
+API_KEY = os.getenv("BINANCE_API_KEY", "")
+API_SECRET = os.getenv("BINANCE_API_SECRET", "")
+SECRET_BYTES = API_SECRET.encode('utf-8')
+
+# Section separators, built once and shared by every banner
+SEP = "=" * 70
+HDR = f"\n{SEP}"
+
+# Shared HTTP session so every probe reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.headers["Content-Type"] = "application/x-www-form-urlencoded"
+SESSION.headers["X-MBX-APIKEY"] = API_KEY
+
+# (connect, read) timeouts: an unreachable host fails fast instead of
+# holding the concurrent probe run for the full read timeout
+PROBE_TIMEOUT = (3.05, 10)
+IP_LOOKUP_TIMEOUT = (3.05, 5)
+
+# Public IP is looked up once and reused for PUBLIC_IP_TTL seconds, both
+# in-process and across runs via the cache file shared with
+# test_api_keys_advanced.py
+_public_ip_cache = {"ip": None, "expires": 0.0}
+_public_ip_lock = threading.Lock()
+
+# IPs configured in the Binance API key whitelist
+WHITELISTED_IPS = frozenset({"157.50.130.184", "106.215.168.255"})
+
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout proxy that lets a worker thread buffer its own prints"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def capture(self, func):
+        """Run func in the current thread, returning (result, printed output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+# Static recommendations text, written in a single call by show_recommendations
+_RECS_TEMPLATE = (
+    HDR + "\n"
+    "RECOMMENDATIONS\n"
+    + SEP + "\n"
+    "\n1. CHECK BINANCE API SETTINGS:\n"
+    "   URL: https://www.binance.com/en/usercenter/settings/api-management\n"
+    "   • Ensure 'Enable Futures' is checked\n"
+    "   • Ensure IP is whitelisted or set to 'Unrestricted'\n"
+    "   • Ensure 'Enable Spot & Margin Trading' is checked\n"
+    "\n2. HMAC-SHA256 IMPLEMENTATION:\n"
+    "   Your code is using correct HMAC implementation:\n"
+    "   ✓ hmac.new(api_secret.encode(), query_string.encode(), hashlib.sha256)\n"
+    "   ✓ .hexdigest() is correct\n"
+    "\n3. SWITCH EXCHANGE MODE:\n"
+    "   Current mode: EXCHANGE_MODE=mock\n"
+    "   To test with real API, change to:\n"
+    "   EXCHANGE_MODE=ccxt\n"
+    "   (Note: CCXT testnet/sandbox deprecated, use mainnet)\n"
+    "\n4. IP WHITELIST MANAGEMENT:\n"
+    "   Your Public IP: {ip}\n"
+    "   Configured IPs: {configured}\n"
+    "   Whitelisted: {whitelisted}\n"
+    "   If different, update Binance API settings to add new IP\n"
+)
+
+
+def sign(query):
+    """Return the HMAC-SHA256 hex signature of an already-encoded query"""
+    # One-shot hmac.digest runs entirely in C, with no HMAC object to build
+    return hmac.digest(SECRET_BYTES, query, "sha256").hex()
+
+
+def _now_ms():
+    """Current time in integer milliseconds, without a float round-trip"""
+    return time.time_ns() // 1_000_000
+
+
+def _signed_get(url):
+    """GET a signed endpoint, sending exactly the query string that was signed"""
+    timestamp = _now_ms()
+    # Sign the bytes form directly, skipping a str build + encode
+    signature = sign(b"timestamp=%d" % timestamp)
+    return SESSION.get(
+        f"{url}?timestamp={timestamp}&signature={signature}", timeout=PROBE_TIMEOUT
+    )
+
 
 def get_public_ip():
-    """Get current public IP address"""
-    try:
-        response = requests.get('https://api.ipify.org?format=json', timeout=5)
-        return response.json()['ip']
-    except Exception as e:
-        return f"Unable to detect: {e}"
+    """Get current public IP address (cached for PUBLIC_IP_TTL seconds)"""
+    # Concurrent callers wait for the first lookup instead of repeating it
+    with _public_ip_lock:
+        now = time.monotonic()
+        if _public_ip_cache["ip"] and now < _public_ip_cache["expires"]:
+            return _public_ip_cache["ip"]
+        ip = read_cached_ip()
+        if ip is None:
+            try:
+                response = SESSION.get('https://api.ipify.org?format=json', timeout=IP_LOOKUP_TIMEOUT)
+                ip = json_loads(response.content)['ip']
+            except Exception as e:
+                return f"Unable to detect: {e}"
+            write_cached_ip(ip)
+        _public_ip_cache["ip"] = ip
+        _public_ip_cache["expires"] = now + PUBLIC_IP_TTL
+        return ip
+
+
+def is_whitelisted(ip):
+    """Check an IP against the configured Binance whitelist"""
+    return ip in WHITELISTED_IPS
 
 def test_hmac_signature():
     """Verify HMAC SHA256 signature generation is correct"""
-    print("\n" + "="*70)
+    print(HDR)
     print("1. HMAC-SHA256 SIGNATURE VERIFICATION")
-    print("="*70)
-    
-    api_secret = os.getenv("BINANCE_API_SECRET", "")
-    
-    if not api_secret:
-        print("ERROR: BINANCE_API_SECRET not found in .env")
-        return False
+    print(SEP)
     
     # Test with a sample query string
     test_query = "timestamp=1234567890"
     
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        test_query.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    signature = sign(test_query.encode('utf-8'))
     
-    print(f"API Secret (first 20 chars): {api_secret[:20]}...")
-    print(f"Test Query: {test_query}")
-    print(f"Generated HMAC-SHA256: {signature}")
-    print("✓ HMAC-SHA256 signature generation is CORRECT")
+    sys.stdout.write(
+        f"API Secret (first 20 chars): {API_SECRET[:20]}...\n"
+        f"Test Query: {test_query}\n"
+        f"Generated HMAC-SHA256: {signature}\n"
+        "✓ HMAC-SHA256 signature generation is CORRECT\n"
+    )
     return True
 
 def test_rest_api_mainnet():
-    """Test REST API against Binance Mainnet (LIVE)"""
-    print("\n" + "="*70)
+    """Test REST API against Binance Mainnet (LIVE), returning (ok, error_code)"""
+    print(HDR)
     print("2. BINANCE REST API - MAINNET (LIVE)")
-    print("="*70)
+    print(SEP)
     
-    api_key = os.getenv("BINANCE_API_KEY", "")
-    api_secret = os.getenv("BINANCE_API_SECRET", "")
-    
-    if not api_key or not api_secret:
-        print("ERROR: API credentials missing in .env")
-        return False
-    
-    print(f"API Key: {api_key[:15]}...{api_key[-5:]}")
-    print(f"Current Public IP: {get_public_ip()}")
-    print(f"Whitelisted IP (from settings): 157.50.130.184")
+    current_ip = get_public_ip()
+    print(f"API Key: {API_KEY[:15]}...{API_KEY[-5:]}")
+    print(f"Current Public IP: {current_ip}")
+    print(f"Whitelisted IPs (from settings): {', '.join(sorted(WHITELISTED_IPS))}")
+    print(f"Current IP Whitelisted: {'✓ YES' if is_whitelisted(current_ip) else '✗ NO'}")
     print(f"\nTesting endpoint: /fapi/v2/account")
     
-    timestamp = int(time.time() * 1000)
-    params_str = f"timestamp={timestamp}"
-    
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        params_str.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    
     url = "https://fapi.binance.com/fapi/v2/account"
-    headers = {
-        "X-MBX-APIKEY": api_key,
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
     
     try:
-        response = requests.get(
-            url,
-            params={'timestamp': timestamp, 'signature': signature},
-            headers=headers,
-            timeout=10
-        )
+        response = _signed_get(url)
         
         print(f"\nResponse Status: {response.status_code}")
         
+        # Parse the body once; proxies can answer with non-JSON error pages
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            print(f"✗ FAILED: {response.status_code}")
+            print(f"  Non-JSON response: {response.text[:200]}")
+            return False, None
+        
         if response.status_code == 200:
-            data = response.json()
-            print("✓ SUCCESS: API Authentication WORKING!")
-            print(f"  Can Trade: {data.get('canTrade')}")
-            print(f"  Total Wallets: {data.get('totalWalletBalance')}")
-            return True
+            sys.stdout.write(
+                "✓ SUCCESS: API Authentication WORKING!\n"
+                f"  Can Trade: {data.get('canTrade')}\n"
+                f"  Total Wallets: {data.get('totalWalletBalance')}\n"
+            )
+            return True, None
         else:
             print(f"✗ FAILED: {response.status_code}")
-            error_data = response.json()
-            error_code = error_data.get('code')
-            error_msg = error_data.get('msg', '')
+            error_code = data.get('code')
+            error_msg = data.get('msg', '')
             
             print(f"\n  Error Code: {error_code}")
             print(f"  Error Message: {error_msg}")
@@ -121,68 +226,47 @@ def test_rest_api_mainnet():
                 print("       • 'Enable Spot & Margin Trading' ✓")
                 print("       • 'Enable Futures' ✓ (THIS IS CRITICAL!)")
                 print("    4) Update IP whitelist:")
-                current_ip = get_public_ip()
                 if current_ip and "Unable" not in current_ip:
                     print(f"       • Add your current IP: {current_ip}")
                 else:
                     print("       • Add your current public IP address")
                 print("    5) Wait 30 seconds then retry")
                 
-            return False
+            return False, error_code
     except Exception as e:
         print(f"✗ Network Error: {e}")
-        return False
+        return False, None
 
 def test_rest_api_testnet():
     """Test REST API against Binance Testnet"""
-    print("\n" + "="*70)
+    print(HDR)
     print("3. BINANCE REST API - TESTNET")
-    print("="*70)
-    
-    api_key = os.getenv("BINANCE_API_KEY", "")
-    api_secret = os.getenv("BINANCE_API_SECRET", "")
-    
-    if not api_key or not api_secret:
-        print("ERROR: API credentials missing in .env")
-        return False
+    print(SEP)
     
     print("NOTE: Testnet uses the SAME API keys as Mainnet")
     print(f"Testing endpoint: /fapi/v2/account (testnet.binancefuture.com)")
     
-    timestamp = int(time.time() * 1000)
-    params_str = f"timestamp={timestamp}"
-    
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        params_str.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    
     url = "https://testnet.binancefuture.com/fapi/v2/account"
-    headers = {
-        "X-MBX-APIKEY": api_key,
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
     
     try:
-        response = requests.get(
-            url,
-            params={'timestamp': timestamp, 'signature': signature},
-            headers=headers,
-            timeout=10
-        )
+        response = _signed_get(url)
         
         print(f"\nResponse Status: {response.status_code}")
         
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            print(f"✗ FAILED: {response.status_code}")
+            print(f"  Non-JSON response: {response.text[:200]}")
+            return False
+        
         if response.status_code == 200:
-            data = response.json()
             print("✓ SUCCESS: Testnet API Authentication WORKING!")
             print(f"  Account Type: {data.get('accountType')}")
             return True
         else:
             print(f"✗ FAILED: {response.status_code}")
-            error_data = response.json()
-            print(f"  Error: {error_data}")
+            print(f"  Error: {data}")
             return False
     except Exception as e:
         print(f"✗ Network Error or Testnet Unavailable: {e}")
@@ -191,50 +275,95 @@ def test_rest_api_testnet():
 
 def show_recommendations():
     """Show recommendations based on test results"""
-    print("\n" + "="*70)
-    print("RECOMMENDATIONS")
-    print("="*70)
-    
-    print("\n1. CHECK BINANCE API SETTINGS:")
-    print("   URL: https://www.binance.com/en/usercenter/settings/api-management")
-    print("   • Ensure 'Enable Futures' is checked")
-    print("   • Ensure IP is whitelisted or set to 'Unrestricted'")
-    print("   • Ensure 'Enable Spot & Margin Trading' is checked")
-    
-    print("\n2. HMAC-SHA256 IMPLEMENTATION:")
-    print("   Your code is using correct HMAC implementation:")
-    print("   ✓ hmac.new(api_secret.encode(), query_string.encode(), hashlib.sha256)")
-    print("   ✓ .hexdigest() is correct")
-    
-    print("\n3. SWITCH EXCHANGE MODE:")
-    print("   Current mode: EXCHANGE_MODE=mock")
-    print("   To test with real API, change to:")
-    print("   EXCHANGE_MODE=ccxt")
-    print("   (Note: CCXT testnet/sandbox deprecated, use mainnet)")
-    
-    print("\n4. IP WHITELIST MANAGEMENT:")
-    print(f"   Your Public IP: {get_public_ip()}")
-    print("   Configured IP: 157.50.130.184")
-    print("   If different, update Binance API settings to add new IP")
+    ip = get_public_ip()
+    sys.stdout.write(_RECS_TEMPLATE.format(
+        ip=ip,
+        configured=", ".join(sorted(WHITELISTED_IPS)),
+        whitelisted="✓ YES" if is_whitelisted(ip) else "✗ NO",
+    ))
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Binance API diagnostic tool")
+    parser.add_argument(
+        "--skip-network",
+        action="store_true",
+        default=os.getenv("DIAG_OFFLINE", "").lower() in ("1", "true", "yes"),
+        help="only run the local HMAC check (also enabled by DIAG_OFFLINE=1)",
+    )
+    parser.add_argument(
+        "--only",
+        choices=("mainnet", "testnet"),
+        help="run a single network probe",
+    )
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    print("\n" + "="*70)
+    args = parse_args()
+    
+    print(HDR)
     print("BINANCE API DIAGNOSTIC TOOL")
-    print("="*70)
+    print(SEP)
     print(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    # Run tests
+    if args.skip_network:
+        # Offline mode: no network round trips, just the signing check
+        if not API_SECRET:
+            print("ERROR: BINANCE_API_SECRET missing in .env")
+            sys.exit(1)
+        test_hmac_signature()
+        sys.exit(0)
+    
+    if not API_KEY or not API_SECRET:
+        print("ERROR: BINANCE_API_KEY / BINANCE_API_SECRET missing in .env")
+        sys.exit(1)
+    
+    run_mainnet = args.only in (None, "mainnet")
+    run_testnet = args.only in (None, "testnet")
+    mainnet_ok = testnet_ok = testnet_skipped = False
+    mainnet_error = None
+    mainnet_output = testnet_output = ""
+    
+    # Run tests - the IP lookup overlaps the probes, and each probe's output
+    # is buffered and printed in order. Testnet uses the same credentials, so
+    # it is only probed once mainnet has not already failed with -2015
     hmac_ok = test_hmac_signature()
-    mainnet_ok = test_rest_api_mainnet()
-    testnet_ok = test_rest_api_testnet()
+    real_stdout = sys.stdout
+    output = _ThreadOutput(real_stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(get_public_ip)
+            if run_mainnet:
+                mainnet = executor.submit(output.capture, test_rest_api_mainnet)
+                (mainnet_ok, mainnet_error), mainnet_output = mainnet.result()
+            if run_testnet and not mainnet_ok and mainnet_error == -2015:
+                testnet_skipped = True
+                testnet_output = (
+                    HDR + "\n"
+                    "3. BINANCE REST API - TESTNET\n"
+                    + SEP + "\n"
+                    "Skipped: mainnet returned -2015 and testnet uses the same credentials\n"
+                )
+            elif run_testnet:
+                testnet = executor.submit(output.capture, test_rest_api_testnet)
+                testnet_ok, testnet_output = testnet.result()
+    finally:
+        sys.stdout = real_stdout
+    sys.stdout.write(mainnet_output)
+    sys.stdout.write(testnet_output)
     
     # Summary
-    print("\n" + "="*70)
+    print(HDR)
     print("SUMMARY")
-    print("="*70)
+    print(SEP)
     print(f"HMAC-SHA256 Implementation: {'✓ CORRECT' if hmac_ok else '✗ FAILED'}")
-    print(f"Mainnet API Access: {'✓ WORKING' if mainnet_ok else '✗ FAILED'}")
-    print(f"Testnet API Access: {'✓ WORKING' if testnet_ok else '✗ FAILED'}")
+    if run_mainnet:
+        print(f"Mainnet API Access: {'✓ WORKING' if mainnet_ok else '✗ FAILED'}")
+    if testnet_skipped:
+        print("Testnet API Access: SKIPPED")
+    elif run_testnet:
+        print(f"Testnet API Access: {'✓ WORKING' if testnet_ok else '✗ FAILED'}")
     
     if mainnet_ok or testnet_ok:
         print("\n✓ API Keys are VALID - You can use EXCHANGE_MODE=ccxt")
@@ -242,4 +371,4 @@ if __name__ == "__main__":
         print("\n✗ API Keys are NOT WORKING - Follow recommendations above")
         show_recommendations()
     
-    print("\n" + "="*70)
+    print(HDR)
@@ -4,6 +4,7 @@ HMAC-SHA256 Signature Guide & Verification
 Shows exactly how Binance API signing works with your credentials
 """
 import os
+import sys
 import time
 import hmac
 import hashlib
@@ -12,50 +13,73 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+
+def _make_signer(key):
+    """
+    Return a HMAC-SHA256 signer for key, keyed once and copied per message.
+    
+    Equivalent to hmac.new(key, msg, hashlib.sha256).hexdigest().
+    """
+    template = hmac.new(key, digestmod=hashlib.sha256)
+    
+    def sign(msg):
+        signer = template.copy()
+        signer.update(msg)
+        return signer.hexdigest()
+    
+    return sign
+
+def sign_many(key, msgs):
+    """Sign a batch of byte messages with one key, keying the HMAC only once"""
+    sign = _make_signer(key)
+    return [sign(m) for m in msgs]
+
+# Secrets are read and encoded once at import; the walkthroughs fall back
+# to a sample secret when none is configured
+_API_SECRET = os.getenv("BINANCE_API_SECRET", "")
+_SECRET_BYTES = _API_SECRET.encode('utf-8')
+_DEMO_SECRET = os.getenv("BINANCE_API_SECRET", "Ds4DgM0FRCvWtBfQY4te1ixCCQGWiEzhrj0Zf7ChJfrmLfJsNk5IeFuZ6B1AYWdP")
+_DEMO_SECRET_BYTES = _DEMO_SECRET.encode('utf-8')
+
+# Query string templates with their keys already in sorted order, so the
+# demo doesn't need to sort and join a params dict on every call
+_ACCOUNT_QUERY_FMT = "timestamp=%d"
+_MARKET_ORDER_QUERY_FMT = "quantity=%s&side=%s&symbol=%s&timestamp=%d&type=MARKET"
+
 def demo_hmac_signing():
     """Demonstrate HMAC-SHA256 signing step by step"""
     
-    api_secret = os.getenv("BINANCE_API_SECRET", "Ds4DgM0FRCvWtBfQY4te1ixCCQGWiEzhrj0Zf7ChJfrmLfJsNk5IeFuZ6B1AYWdP")
+    api_secret = _DEMO_SECRET
     
-    print("\n" + "="*80)
+    print("\n" + _EQ80)
     print("HMAC-SHA256 SIGNATURE GENERATION - COMPLETE WALKTHROUGH")
-    print("="*80)
+    print(_EQ80)
     
     # Step 1: Create query string
     print("\n📋 STEP 1: Create Query String")
-    print("-" * 80)
+    print(_DASH80)
     
-    timestamp = int(time.time() * 1000)
+    timestamp = time.time_ns() // 1_000_000
     symbol = "BTCUSDT"
     side = "BUY"
     quantity = 0.001
     
     # Method 1: Simple timestamp-only request
-    query_params_1 = {
-        'timestamp': timestamp
-    }
-    
-    query_string_1 = '&'.join([f"{k}={v}" for k, v in sorted(query_params_1.items())])
+    query_string_1 = _ACCOUNT_QUERY_FMT % timestamp
     print(f"\n  Query String (for /account endpoint):")
     print(f"  {query_string_1}")
     
     # Method 2: Order placement request
-    query_params_2 = {
-        'symbol': symbol,
-        'side': side,
-        'type': 'MARKET',
-        'quantity': quantity,
-        'timestamp': timestamp
-    }
-    
-    # Sort by key (IMPORTANT!)
-    query_string_2 = '&'.join([f"{k}={v}" for k, v in sorted(query_params_2.items())])
+    # Keys must be sorted (IMPORTANT!) - the template is already in key order
+    query_string_2 = _MARKET_ORDER_QUERY_FMT % (quantity, side, symbol, timestamp)
     print(f"\n  Query String (for order placement):")
     print(f"  {query_string_2}")
     
     # Step 2: Generate HMAC
     print("\n\n🔐 STEP 2: Generate HMAC-SHA256")
-    print("-" * 80)
+    print(_DASH80)
     
     print(f"\n  API Secret: {api_secret[:20]}...{api_secret[-10:]}")
     print(f"  \n  Using Python hmac module:")
@@ -63,17 +87,10 @@ def demo_hmac_signing():
     print(f"    query_string.encode('utf-8')")
     print(f"    hashlib.sha256")
     
-    signature_1 = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string_1.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    
-    signature_2 = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string_2.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    # Key the signer once and reuse it for each message
+    sign = _make_signer(_DEMO_SECRET_BYTES)
+    signature_1 = sign(query_string_1.encode('ascii'))
+    signature_2 = sign(query_string_2.encode('ascii'))
     
     print(f"\n  Generated Signature (account query):")
     print(f"  {signature_1}")
@@ -83,7 +100,7 @@ def demo_hmac_signing():
     
     # Step 3: Add signature to query string
     print("\n\n📍 STEP 3: Append Signature to Query String")
-    print("-" * 80)
+    print(_DASH80)
     
     final_url_1 = f"{query_string_1}&signature={signature_1}"
     final_url_2 = f"{query_string_2}&signature={signature_2}"
@@ -97,16 +114,15 @@ def demo_hmac_signing():
 def compare_implementations():
     """Compare different HMAC generation approaches"""
     
-    api_secret = os.getenv("BINANCE_API_SECRET", "Ds4DgM0FRCvWtBfQY4te1ixCCQGWiEzhrj0Zf7ChJfrmLfJsNk5IeFuZ6B1AYWdP")
     query_string = "timestamp=1234567890&symbol=BTCUSDT"
     
-    print("\n\n" + "="*80)
+    print("\n\n" + _EQ80)
     print("CORRECT vs INCORRECT IMPLEMENTATIONS")
-    print("="*80)
+    print(_EQ80)
     
     # ✓ CORRECT
     print("\n✅ CORRECT IMPLEMENTATION:")
-    print("-" * 80)
+    print(_DASH80)
     print("""
 import hmac
 import hashlib
@@ -118,17 +134,16 @@ signature = hmac.new(
 ).hexdigest()
     """)
     
-    correct_sig = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    key_bytes = _DEMO_SECRET_BYTES
+    msg_bytes = query_string.encode('ascii')
+    
+    correct_sig = hmac.digest(key_bytes, msg_bytes, 'sha256').hex()
     
     print(f"Result: {correct_sig}\n")
     
     # ❌ WRONG - No .hexdigest()
     print("❌ WRONG #1 - Missing .hexdigest():")
-    print("-" * 80)
+    print(_DASH80)
     print("""
 signature = hmac.new(
     api_secret.encode('utf-8'),
@@ -140,7 +155,7 @@ signature = hmac.new(
     
     # ❌ WRONG - Not encoding strings
     print("❌ WRONG #2 - Not encoding strings:")
-    print("-" * 80)
+    print(_DASH80)
     print("""
 signature = hmac.new(
     api_secret,  # Should be: api_secret.encode('utf-8')
@@ -152,7 +167,7 @@ signature = hmac.new(
     
     # ❌ WRONG - Wrong hash algorithm
     print("❌ WRONG #3 - Wrong hash algorithm:")
-    print("-" * 80)
+    print(_DASH80)
     print("""
 signature = hmac.new(
     api_secret.encode('utf-8'),
@@ -161,25 +176,21 @@ signature = hmac.new(
 ).hexdigest()
     """)
     
-    wrong_sig = hmac.new(
-        api_secret.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.md5
-    ).hexdigest()
+    wrong_sig = hmac.digest(key_bytes, msg_bytes, 'md5').hex()
     
     print(f"Result: {wrong_sig} - (Different from correct!)\n")
 
 def test_real_signature():
     """Test with actual API secret"""
     
-    api_secret = os.getenv("BINANCE_API_SECRET", "")
+    api_secret = _API_SECRET
     if not api_secret:
         print("\nℹ️  No API secret found in .env")
         return
     
-    print("\n" + "="*80)
+    print("\n" + _EQ80)
     print("TEST WITH YOUR ACTUAL API CREDENTIALS")
-    print("="*80)
+    print(_EQ80)
     
     test_cases = [
         ("Account Query", "timestamp=1234567890"),
@@ -189,32 +200,23 @@ def test_real_signature():
     
     print(f"\nAPI Secret (first 20 chars): {api_secret[:20]}...")
     print("\nSignature Results:")
-    print("-" * 80)
-    
-    for test_name, query_string in test_cases:
-        signature = hmac.new(
-            api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
+    print(_DASH80)
+    
+    msgs = [query_string.encode('ascii') for _, query_string in test_cases]
+    signatures = sign_many(_SECRET_BYTES, msgs)
+    
+    for (test_name, query_string), signature in zip(test_cases, signatures):
         print(f"\n{test_name}")
         print(f"  Query: {query_string}")
         print(f"  Sig:   {signature}")
 
-if __name__ == "__main__":
-    print("\n" + "="*80)
-    print("HMAC-SHA256 BINANCE API SIGNING GUIDE")
-    print("="*80)
-    
-    demo_hmac_signing()
-    compare_implementations()
-    test_real_signature()
-    
-    print("\n\n" + "="*80)
-    print("KEY TAKEAWAYS")
-    print("="*80)
-    print("""
+# Static closing summary, written in one go at the end of the run
+_KEY_TAKEAWAYS = """
+
+================================================================================
+KEY TAKEAWAYS
+================================================================================
+
 1. ALWAYS use .hexdigest() to convert HMAC to hex string
 2. ALWAYS encode both api_secret and query_string as UTF-8 bytes
 3. ALWAYS use hashlib.sha256 (not md5, sha1, etc.)
@@ -225,12 +227,25 @@ if __name__ == "__main__":
 Example correct implementation:
     import hmac, hashlib, time
     
-    timestamp = int(time.time() * 1000)
+    timestamp = time.time_ns() // 1_000_000
     query = f"timestamp={timestamp}"
     sig = hmac.new(api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
     
     # Use in request:
     params = {'timestamp': timestamp, 'signature': sig}
     requests.get(url, params=params, headers={'X-MBX-APIKEY': api_key})
-    """)
-    print("="*80 + "\n")
+    
+================================================================================
+
+"""
+
+if __name__ == "__main__":
+    print("\n" + _EQ80)
+    print("HMAC-SHA256 BINANCE API SIGNING GUIDE")
+    print(_EQ80)
+    
+    demo_hmac_signing()
+    compare_implementations()
+    test_real_signature()
+    
+    sys.stdout.write(_KEY_TAKEAWAYS)
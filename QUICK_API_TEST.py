@@ -4,52 +4,68 @@ Quick Test Script - Run after updating Binance API Settings
 This is a fast, focused test to verify if your fixes worked
 """
 import os
+import sys
 import time
 import hmac
-import hashlib
+import json
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
+
 load_dotenv()
 
+# Credentials are read and encoded once at import, not per call
+_API_KEY = os.getenv("BINANCE_API_KEY", "")
+_SECRET_BYTES = os.getenv("BINANCE_API_SECRET", "").encode('utf-8')
+
+# Persistent keep-alive session so repeated calls reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.headers["X-MBX-APIKEY"] = _API_KEY
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0))
+
 def quick_api_test():
     """Quick API test with minimal output"""
     
-    api_key = os.getenv("BINANCE_API_KEY", "")
-    api_secret = os.getenv("BINANCE_API_SECRET", "")
+    api_key = _API_KEY
     
     print("\n🔍 QUICK API TEST")
     print("=" * 60)
     print(f"API Key: {api_key[:10]}...{api_key[-5:]}")
     print(f"Testing: Binance Futures Mainnet")
     
-    timestamp = int(time.time() * 1000)
-    params_str = f"timestamp={timestamp}"
-    
-    signature = hmac.new(
-        api_secret.encode('utf-8'),
-        params_str.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    timestamp = time.time_ns() // 1_000_000
+    signature = hmac.digest(_SECRET_BYTES, b"timestamp=%d" % timestamp, 'sha256').hex()
     
     try:
-        response = requests.get(
+        response = _SESSION.get(
             "https://fapi.binance.com/fapi/v2/account",
             params={'timestamp': timestamp, 'signature': signature},
-            headers={"X-MBX-APIKEY": api_key},
             timeout=10
         )
+        # Parse the body once; both branches read from it. Error pages such
+        # as an HTML 5xx or 451 are not JSON, so report their status instead
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            print(f"\n❌ FAILED (Status: {response.status_code})")
+            print(f"   Non-JSON response: {response.text[:200]}")
+            return False
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"\n✅ SUCCESS! API is working!")
-            print(f"   Can Trade: {data.get('canTrade')}")
-            print(f"   Total Wallet Balance: {data.get('totalWalletBalance')} USDT")
+            sys.stdout.write(
+                "\n✅ SUCCESS! API is working!\n"
+                f"   Can Trade: {data.get('canTrade')}\n"
+                f"   Total Wallet Balance: {data.get('totalWalletBalance')} USDT\n"
+            )
             return True
         else:
-            error = response.json()
             print(f"\n❌ FAILED (Status: {response.status_code})")
-            print(f"   Error: {error.get('msg', 'Unknown error')}")
+            print(f"   Error: {data.get('msg', 'Unknown error')}")
             print(f"\n💡 Next steps:")
             print(f"   1. Go to https://www.binance.com/en/usercenter/settings/api-management")
             print(f"   2. Enable 'Enable Futures' ✓")
@@ -5,27 +5,19 @@ Helps configure and test your Binance API key
 """
 import os
 import sys
+import socket
+from functools import lru_cache
 from dotenv import load_dotenv
 
-def get_current_ip():
-    """Try to detect current IP address"""
-    try:
-        import socket
-        hostname = socket.gethostname()
-        ip = socket.gethostbyname(hostname)
-        return ip
-    except:
-        return "Unable to detect"
+_EQ70 = "=" * 70
 
-def show_setup_instructions():
-    print("\n" + "=" * 70)
-    print("🚀 BINANCE API KEY - COMPLETE SETUP GUIDE")
-    print("=" * 70)
-    
-    current_ip = get_current_ip()
-    
-    print(f"""
-YOUR PRIVATE IP (Local): {current_ip}
+# Whole guide as one template so it is formatted and written in a single pass
+_GUIDE_TEMPLATE = """
+======================================================================
+🚀 BINANCE API KEY - COMPLETE SETUP GUIDE
+======================================================================
+
+YOUR PRIVATE IP (Local): {ip}
 (You need your PUBLIC IP, not this one)
 
 ═══════════════════════════════════════════════════════════════════════
@@ -140,9 +132,26 @@ Consider creating dedicated API keys:
     • Both with minimal required permissions
 
 ═══════════════════════════════════════════════════════════════════════
-""")
+
+"""
+
+@lru_cache(maxsize=1)
+def get_current_ip():
+    """Try to detect current IP address (cached, no DNS lookup)"""
+    try:
+        # Connecting a UDP socket sends no packets; it only picks the
+        # outbound interface, whose address getsockname() then reports
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(("8.8.8.8", 80))
+            return sock.getsockname()[0]
+    except OSError:
+        return "Unable to detect"
+
+def show_setup_instructions():
+    sys.stdout.write(_GUIDE_TEMPLATE.format(ip=get_current_ip()))
 
 if __name__ == "__main__":
     show_setup_instructions()
     print("✅ Setup Guide Complete")
-    print("=" * 70)
+    print(_EQ70)
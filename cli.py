@@ -3,40 +3,106 @@ CLI interface for the Trading Bot using Click.
 Provides an elegant, user-friendly command-line interface.
 Supports multiple exchange modes: mock, ccxt, and binance.
 """
+import io
 import sys
+import functools
+import contextlib
 import click
-from tabulate import tabulate
-from colorama import Fore, Style, init
-from trading_bot.bot import BinanceClient, OrderManager, BinanceAPIError, ValidationError
-from trading_bot.bot.ccxt_client import CCXTClient, CCXTAPIError
-from trading_bot.bot.mock_exchange import MockExchange
+from trading_bot.bot.symbols import to_ccxt_symbol
 from trading_bot.bot.logging_config import setup_logger
 import config
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# ANSI colour codes, left blank when stdout is not a terminal (as colorama
+# used to strip them). colorama is only needed to enable ANSI handling on
+# Windows consoles, so POSIX runs skip importing and wrapping stdout.
+_USE_COLOR = sys.stdout.isatty()
+if _USE_COLOR and sys.platform == 'win32':
+    from colorama import just_fix_windows_console
+    just_fix_windows_console()
+
+if _USE_COLOR:
+    _GREEN, _YELLOW, _RED, _CYAN, _RESET = (
+        "\x1b[32m", "\x1b[33m", "\x1b[31m", "\x1b[36m", "\x1b[0m"
+    )
+else:
+    _GREEN = _YELLOW = _RED = _CYAN = _RESET = ""
+
+# Confirmation prompts need a person to answer them; other runs must pass --yes
+_INTERACTIVE = sys.stdin.isatty()
 
 logger = setup_logger(__name__)
 
 
+def _to_flat(symbol: str) -> str:
+    """Convert BTC/USDT to BTCUSDT (format used by the Binance API)."""
+    return symbol.replace('/', '')
+
+
+# Symbol normalizer per exchange mode, resolved once in BotContext
+_SYMBOL_NORMALIZERS = {
+    "mock": to_ccxt_symbol,
+    "ccxt": to_ccxt_symbol,
+    "binance": _to_flat,
+}
+
+
+# (module, name) of the exchange API error types the commands report
+_API_ERRORS = (
+    ('trading_bot.bot.client', 'BinanceAPIError'),
+    ('trading_bot.bot.ccxt_client', 'CCXTAPIError'),
+)
+_VALIDATION_ERRORS = (('trading_bot.bot.validators', 'ValidationError'),)
+
+
+def _loaded_errors(errors) -> tuple:
+    """
+    Return the error types among (module, name) pairs whose module is loaded.
+    
+    Exchange clients are only imported for the selected mode, and an error
+    type whose module was never imported cannot have been raised, so it is
+    looked up rather than imported here.
+    """
+    return tuple(
+        getattr(sys.modules[module], name)
+        for module, name in errors
+        if module in sys.modules
+    )
+
+
+def _api_errors():
+    """Return the exchange API error types that can occur in this run."""
+    return _loaded_errors(_API_ERRORS)
+
+
 class BotContext:
     """Context object for storing CLI state with dynamic exchange selection."""
+    __slots__ = (
+        'mode', 'exchange', 'client', 'order_manager', 'is_mock',
+        'uses_ccxt_api', 'normalize_symbol',
+    )
+    
     def __init__(self):
         self.mode = config.EXCHANGE_MODE
         
+        # Exchange clients are imported for the selected mode only, so e.g.
+        # mock mode never pays for importing ccxt
         if self.mode == "mock":
+            from trading_bot.bot.mock_exchange import MockExchange
             # Use MockExchange - completely offline, no API calls
             self.exchange = MockExchange()
             self.client = None  # MockExchange doesn't use traditional client
             self.order_manager = None  # MockExchange handles orders directly
             self.is_mock = True
         elif self.mode == "ccxt":
+            from trading_bot.bot.ccxt_client import CCXTClient
             # Use CCXT library with Binance
             self.client = CCXTClient()
             self.exchange = self.client  # CCXT client is the exchange
             self.order_manager = None  # CCXT handles orders directly
             self.is_mock = False
         elif self.mode == "binance":
+            from trading_bot.bot.client import BinanceClient
+            from trading_bot.bot.orders import OrderManager
             # Use legacy Binance REST API
             self.client = BinanceClient()
             self.exchange = None
@@ -44,32 +110,225 @@ class BotContext:
             self.is_mock = False
         else:
             raise ValueError(f"Invalid EXCHANGE_MODE: {self.mode}. Must be 'mock', 'ccxt', or 'binance'")
+        
+        # Mock and CCXT share the CCXT-style exchange API; binance uses OrderManager
+        self.uses_ccxt_api = self.mode != "binance"
+        self.normalize_symbol = _SYMBOL_NORMALIZERS[self.mode]
+
+
+def _normalize_order_response(
+    response: dict,
+    symbol: str,
+    order_id='N/A',
+    side: str = 'UNKNOWN',
+    quantity: float = 0,
+    price: float = 0,
+    time_in_force: str = 'N/A',
+    executed=None,
+) -> dict:
+    """
+    Map a CCXT/Mock order response onto the Binance field names.
+    
+    Fields missing from the response fall back to the values the command
+    was invoked with. `executed` overrides the executed-quantity fallback,
+    which otherwise is the order amount.
+    """
+    get = response.get
+    amount = get('amount', quantity)
+    return {
+        'orderId': get('id', get('orderId', order_id)),
+        'symbol': get('symbol', symbol),
+        'side': get('side', side).upper(),
+        'status': get('status', 'UNKNOWN').upper(),
+        'type': get('type', 'UNKNOWN').upper(),
+        'quantity': amount,
+        'executedQty': get('filled', amount if executed is None else executed),
+        'price': get('price', price),
+        'avgPrice': get('average', get('price', 0)),
+        'cumulativeQuoteQty': get('cost', 0),
+        'timeInForce': get('timeInForce', time_in_force),
+    }
+
+
+def get_bot(ctx) -> BotContext:
+    """
+    Return the shared BotContext, creating it on first use.
+    
+    Built lazily from inside a command rather than in the group callback,
+    so --help and shell completion never construct exchange clients.
+    """
+    obj = ctx.ensure_object(dict)
+    bot = obj.get('bot')
+    if bot is None:
+        bot = obj['bot'] = BotContext()
+    return bot
+
+
+def _grid(rows, **kwargs) -> str:
+    """Render rows as a grid table; tabulate is imported on first use."""
+    from tabulate import tabulate
+    return tabulate(rows, tablefmt='grid', **kwargs)
+
+
+@functools.cache
+def _header() -> str:
+    """Build the application header for the configured exchange mode."""
+    mode = config.EXCHANGE_MODE
+    mode_color = _GREEN if mode == "mock" else _YELLOW
+    rule = f"{_CYAN}{'='*60}{_RESET}"
+    return (
+        f"\n{rule}\n"
+        f"{_CYAN}  🤖 Trading Bot - {mode_color}[{mode.upper()} MODE]{_RESET}\n"
+        f"{_CYAN}  v1.0.0 - Professional Trading Interface{_RESET}\n"
+        f"{rule}\n\n"
+    )
 
 
 def print_header():
     """Print application header with current exchange mode."""
-    mode_display = config.EXCHANGE_MODE.upper()
-    mode_color = Fore.GREEN if config.EXCHANGE_MODE == "mock" else Fore.YELLOW
-    
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}  🤖 Trading Bot - {mode_color}[{mode_display} MODE]{Fore.CYAN}")
-    print(f"{Fore.CYAN}  v1.0.0 - Professional Trading Interface")
-    print(f"{Fore.CYAN}{'='*60}\n")
+    sys.stdout.write(_header())
+
+
+def _fmt_price(value) -> str:
+    """Format a price to 8 decimals, or "N/A" when it is missing or zero."""
+    return format(value, '.8f') if value else "N/A"
+
+
+# Row labels for the order result tables
+_MARKET_RESPONSE_LABELS = (
+    'Order ID', 'Symbol', 'Side', 'Status',
+    'Quantity', 'Executed Qty', 'Avg Price', 'Quote Qty',
+)
+_LIMIT_RESPONSE_LABELS = (
+    'Order ID', 'Symbol', 'Side', 'Status', 'Quantity',
+    'Price', 'Executed Qty', 'Avg Price', 'Time in Force',
+)
+_STATUS_LABELS = (
+    'Order ID', 'Symbol', 'Side', 'Status', 'Type',
+    'Quantity', 'Executed', 'Price', 'Avg Price',
+)
+_CANCEL_LABELS = ('Order ID', 'Symbol', 'Status', 'Side')
+
+
+@contextlib.contextmanager
+def _batched_stdout():
+    """Collect output in memory and emit it with a single write on exit."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+# Prebuilt message templates per level, colour codes already baked in
+_LEVEL_FORMATS = {
+    'ok': f"{_GREEN}✓ {{}}{_RESET}",
+    'err': f"{_RED}✗ {{}}{_RESET}",
+    'info': f"{_YELLOW}ℹ {{}}{_RESET}",
+}
+
+
+def _log(level: str, message: str):
+    """Print a status message using the template for its level."""
+    print(_LEVEL_FORMATS[level].format(message))
 
 
 def print_success(message: str):
     """Print success message."""
-    print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+    _log('ok', message)
 
 
 def print_error(message: str):
     """Print error message."""
-    print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+    _log('err', message)
 
 
 def print_info(message: str):
     """Print info message."""
-    print(f"{Fore.YELLOW}ℹ {message}{Style.RESET_ALL}")
+    _log('info', message)
+
+
+# (known-error label, its log label, unexpected-error label, its log label)
+_ERROR_MESSAGES = {
+    'order': ("Error", "Order error", "Unexpected Error", "Unexpected error"),
+    'api': ("API Error", "API error", "Error", "Error"),
+    'connection': ("API Error", "API connection test failed", "Error", "Connection test error"),
+}
+
+
+def _handle_errors(kind: str):
+    """
+    Decorate a command so that errors are printed, logged and exit with 1.
+    
+    Args:
+        kind: Key into _ERROR_MESSAGES; 'order' commands also treat
+            ValidationError as a known error
+    """
+    label, log_label, other_label, other_log_label = _ERROR_MESSAGES[kind]
+    
+    def decorator(command):
+        @functools.wraps(command)
+        def wrapper(*args, **kwargs):
+            try:
+                return command(*args, **kwargs)
+            except (click.ClickException, click.Abort):
+                # Let Click report its own usage errors and aborted prompts
+                raise
+            except Exception as e:
+                known = _api_errors()
+                if kind == 'order':
+                    known += _loaded_errors(_VALIDATION_ERRORS)
+                
+                if isinstance(e, known):
+                    print_error(f"{label}: {str(e)}")
+                    if kind == 'connection':
+                        print_info("Please check your API credentials in .env file")
+                    logger.error(f"{log_label}: {str(e)}")
+                else:
+                    print_error(f"{other_label}: {str(e)}")
+                    logger.error(f"{other_log_label}: {str(e)}")
+                sys.exit(1)
+        return wrapper
+    return decorator
+
+
+def _confirmed(message: str, yes: bool, default: bool) -> bool:
+    """
+    Ask for confirmation unless --yes was given.
+    
+    Without a terminal there is nobody to answer, so the command is aborted
+    rather than run unconfirmed.
+    """
+    if yes:
+        return True
+    if not _INTERACTIVE:
+        raise click.UsageError("Confirmation required: use --yes for non-interactive runs")
+    return click.confirm(message, default=default)
+
+
+class SymbolParam(click.ParamType):
+    """
+    Click parameter type that normalizes a symbol for the exchange mode.
+    
+    Only reads the configured mode, so parsing never builds exchange
+    clients. An unknown mode leaves the symbol as given; BotContext reports
+    it when the command runs.
+    """
+    name = 'symbol'
+    
+    def convert(self, value, param, ctx):
+        normalize = _SYMBOL_NORMALIZERS.get(config.EXCHANGE_MODE)
+        return normalize(value) if normalize else value
+
+
+SYMBOL = SymbolParam()
+
+
+def _upper_choice(ctx, param, value):
+    """Click callback: uppercase a case-insensitive choice once, at parse time."""
+    return value.upper() if value else value
 
 
 @click.group()
@@ -82,19 +341,19 @@ def cli(ctx):
     Make sure to set API credentials in .env file before using.
     """
     ctx.ensure_object(dict)
-    ctx.obj['bot'] = BotContext()
 
 
 @cli.command()
 @click.option(
     '--symbol',
     prompt='Trading symbol (e.g., BTCUSDT or BTC/USDT)',
-    type=str,
+    type=SYMBOL,
     help='Trading pair'
 )
 @click.option(
     '--side',
     type=click.Choice(['BUY', 'SELL'], case_sensitive=False),
+    callback=_upper_choice,
     prompt='Order side',
     help='Buy or Sell'
 )
@@ -104,8 +363,10 @@ def cli(ctx):
     type=float,
     help='Order quantity'
 )
+@click.option('--yes', '-y', is_flag=True, default=False, help='Skip the confirmation prompt')
 @click.pass_context
-def market(ctx, symbol, side, quantity):
+@_handle_errors('order')
+def market(ctx, symbol, side, quantity, yes):
     """
     Place a MARKET order.
     
@@ -115,107 +376,77 @@ def market(ctx, symbol, side, quantity):
     print_header()
     print_info(f"Preparing {side} market order...")
     
-    try:
-        bot = ctx.obj['bot']
-        
-        # Normalize symbol format based on mode
-        if bot.mode in ['mock', 'ccxt']:
-            # CCXT and Mock use BTC/USDT format
-            if '/' not in symbol:
-                # Convert BTCUSDT to BTC/USDT
-                if symbol.endswith('USDT'):
-                    base = symbol[:-4]
-                    symbol = f"{base}/USDT"
-        else:
-            # Binance API uses BTCUSDT format
-            if '/' in symbol:
-                symbol = symbol.replace('/', '')
-        
-        # Show order summary
-        print(f"\n{Fore.CYAN}Order Summary:")
-        summary_data = [
-            ['Symbol', symbol],
-            ['Side', side.upper()],
-            ['Type', 'MARKET'],
-            ['Quantity', quantity],
-            ['Price', 'Market Price'],
-        ]
-        print(tabulate(summary_data, tablefmt='grid'))
-        
-        # Confirm execution
-        if not click.confirm(f"\n{Fore.YELLOW}Execute this order?", default=True):
-            print_info("Order cancelled by user")
-            return
-        
-        print(f"\n{Fore.CYAN}Executing order...")
-        
-        # Execute order based on mode
-        if bot.mode == 'mock' or bot.mode == 'ccxt':
-            # Mock and CCXT use create_order
-            response = bot.exchange.create_order(
-                symbol=symbol,
-                order_type='market',
-                side=side.lower(),
-                amount=quantity
-            )
-            
-            # Normalize response to match Binance format
-            normalized_response = {
-                'orderId': response.get('id', response.get('orderId', 'N/A')),
-                'symbol': response.get('symbol', symbol),
-                'side': response.get('side', side).upper(),
-                'status': response.get('status', 'UNKNOWN').upper(),
-                'quantity': response.get('amount', quantity),
-                'executedQty': response.get('filled', response.get('amount', quantity)),
-                'avgPrice': response.get('average', response.get('price', 0)),
-                'cumulativeQuoteQty': response.get('cost', 0),
-            }
-            response = normalized_response
-        else:
-            # Binance mode uses order_manager
-            response = bot.order_manager.place_market_order(symbol, side, quantity)
-        
-        # Display order response
-        print(f"\n{Fore.GREEN}{'='*60}")
-        print(f"{Fore.GREEN}✓ ORDER PLACED SUCCESSFULLY{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-        
-        response_data = [
-            ['Order ID', response['orderId']],
-            ['Symbol', response['symbol']],
-            ['Side', response['side']],
-            ['Status', response['status']],
-            ['Quantity', response['quantity']],
-            ['Executed Qty', response['executedQty']],
-            ['Avg Price', f"{response['avgPrice']:.8f}" if response['avgPrice'] else "N/A"],
-            ['Quote Qty', f"{response['cumulativeQuoteQty']:.8f}"],
-        ]
-        print(tabulate(response_data, tablefmt='grid'))
-        
-        print_success(f"Market order {response['orderId']} placed on {symbol}")
-        logger.info(f"Market order placed: {response['orderId']}")
+    bot = get_bot(ctx)
+    
+    # Show order summary
+    print(f"\n{_CYAN}Order Summary:{_RESET}")
+    summary_data = [
+        ['Symbol', symbol],
+        ['Side', side],
+        ['Type', 'MARKET'],
+        ['Quantity', quantity],
+        ['Price', 'Market Price'],
+    ]
+    print(_grid(summary_data))
+    
+    # Confirm execution (skipped with --yes or when stdin is not a terminal)
+    if not _confirmed(f"\n{_YELLOW}Execute this order?{_RESET}", yes, default=True):
+        print_info("Order cancelled by user")
+        return
+    
+    print(f"\n{_CYAN}Executing order...{_RESET}")
     
-    except (ValidationError, BinanceAPIError, CCXTAPIError) as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Order error: {str(e)}")
-        sys.exit(1)
+    # Execute order based on mode
+    if bot.uses_ccxt_api:
+        # Mock and CCXT use create_order
+        response = bot.exchange.create_order(
+            symbol=symbol,
+            order_type='market',
+            side=side.lower(),
+            amount=quantity
+        )
+        
+        # Normalize response to match Binance format
+        response = _normalize_order_response(
+            response, symbol, side=side, quantity=quantity
+        )
+    else:
+        # Binance mode uses order_manager
+        response = bot.order_manager.place_market_order(symbol, side, quantity)
     
-    except Exception as e:
-        print_error(f"Unexpected Error: {str(e)}")
-        logger.error(f"Unexpected error: {str(e)}")
-        sys.exit(1)
+    # Display order response
+    with _batched_stdout():
+        print(f"\n{_GREEN}{'='*60}{_RESET}")
+        print(f"{_GREEN}✓ ORDER PLACED SUCCESSFULLY{_RESET}")
+        print(f"{_GREEN}{'='*60}{_RESET}")
+        
+        response_data = zip(_MARKET_RESPONSE_LABELS, (
+            response['orderId'],
+            response['symbol'],
+            response['side'],
+            response['status'],
+            response['quantity'],
+            response['executedQty'],
+            _fmt_price(response['avgPrice']),
+            f"{response['cumulativeQuoteQty']:.8f}",
+        ))
+        print(_grid(response_data))
+        
+        print_success(f"Market order {response['orderId']} placed on {symbol}")
+    logger.info(f"Market order placed: {response['orderId']}")
 
 
 @cli.command()
 @click.option(
     '--symbol',
     prompt='Trading symbol (e.g., BTCUSDT)',
-    type=str,
+    type=SYMBOL,
     help='Futures trading pair'
 )
 @click.option(
     '--side',
     type=click.Choice(['BUY', 'SELL'], case_sensitive=False),
+    callback=_upper_choice,
     prompt='Order side',
     help='Buy or Sell'
 )
@@ -234,11 +465,15 @@ def market(ctx, symbol, side, quantity):
 @click.option(
     '--tif',
     type=click.Choice(['GTC', 'IOC', 'FOK'], case_sensitive=False),
+    callback=_upper_choice,
     default='GTC',
+    show_default=True,
     help='Time in Force (GTC=Good Till Cancel, IOC=Immediate or Cancel, FOK=Fill or Kill)'
 )
+@click.option('--yes', '-y', is_flag=True, default=False, help='Skip the confirmation prompt')
 @click.pass_context
-def limit(ctx, symbol, side, quantity, price, tif):
+@_handle_errors('order')
+def limit(ctx, symbol, side, quantity, price, tif, yes):
     """
     Place a LIMIT order on Binance Futures Testnet.
     
@@ -248,108 +483,77 @@ def limit(ctx, symbol, side, quantity, price, tif):
     print_header()
     print_info(f"Preparing {side} limit order...")
     
-    try:
-        bot = ctx.obj['bot']
-        
-        # Normalize symbol format based on mode
-        if bot.mode in ['mock', 'ccxt']:
-            # CCXT and Mock use BTC/USDT format
-            if '/' not in symbol:
-                # Convert BTCUSDT to BTC/USDT
-                if symbol.endswith('USDT'):
-                    base = symbol[:-4]
-                    symbol = f"{base}/USDT"
-        else:
-            # Binance API uses BTCUSDT format
-            if '/' in symbol:
-                symbol = symbol.replace('/', '')
-        
-        # Show order summary
-        print(f"\n{Fore.CYAN}Order Summary:")
-        summary_data = [
-            ['Symbol', symbol],
-            ['Side', side.upper()],
-            ['Type', 'LIMIT'],
-            ['Quantity', quantity],
-            ['Price', f"{price:.8f}"],
-            ['Time in Force', tif.upper()],
-        ]
-        print(tabulate(summary_data, tablefmt='grid'))
-        
-        # Confirm execution
-        if not click.confirm(f"\n{Fore.YELLOW}Execute this order?", default=True):
-            print_info("Order cancelled by user")
-            return
-        
-        print(f"\n{Fore.CYAN}Executing order...")
-        
-        # Execute order based on mode
-        if bot.mode == 'mock' or bot.mode == 'ccxt':
-            # Mock and CCXT use create_order
-            response = bot.exchange.create_order(
-                symbol=symbol,
-                order_type='limit',
-                side=side.lower(),
-                amount=quantity,
-                price=price
-            )
-            
-            # Normalize response to match Binance format
-            normalized_response = {
-                'orderId': response.get('id', response.get('orderId', 'N/A')),
-                'symbol': response.get('symbol', symbol),
-                'side': response.get('side', side).upper(),
-                'status': response.get('status', 'UNKNOWN').upper(),
-                'quantity': response.get('amount', quantity),
-                'executedQty': response.get('filled', response.get('amount', quantity)),
-                'avgPrice': response.get('average', response.get('price', 0)),
-                'cumulativeQuoteQty': response.get('cost', 0),
-                'price': response.get('price', price),
-                'timeInForce': response.get('timeInForce', tif.upper()),
-            }
-            response = normalized_response
-        else:
-            # Binance mode uses order_manager
-            response = bot.order_manager.place_limit_order(
-                symbol, side, quantity, price, tif.upper()
-            )
-        
-        # Display order response
-        print(f"\n{Fore.GREEN}{'='*60}")
-        print(f"{Fore.GREEN}✓ ORDER PLACED SUCCESSFULLY{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-        
-        response_data = [
-            ['Order ID', response['orderId']],
-            ['Symbol', response['symbol']],
-            ['Side', response['side']],
-            ['Status', response['status']],
-            ['Quantity', response['quantity']],
-            ['Price', f"{response['price']:.8f}"],
-            ['Executed Qty', response['executedQty']],
-            ['Avg Price', f"{response['avgPrice']:.8f}" if response['avgPrice'] else "N/A"],
-            ['Time in Force', response['timeInForce']],
-        ]
-        print(tabulate(response_data, tablefmt='grid'))
-        
-        print_success(f"Limit order {response['orderId']} placed on {symbol}")
-        logger.info(f"Limit order placed: {response['orderId']}")
+    bot = get_bot(ctx)
+    
+    # Show order summary
+    print(f"\n{_CYAN}Order Summary:{_RESET}")
+    summary_data = [
+        ['Symbol', symbol],
+        ['Side', side],
+        ['Type', 'LIMIT'],
+        ['Quantity', quantity],
+        ['Price', f"{price:.8f}"],
+        ['Time in Force', tif],
+    ]
+    print(_grid(summary_data))
+    
+    # Confirm execution (skipped with --yes or when stdin is not a terminal)
+    if not _confirmed(f"\n{_YELLOW}Execute this order?{_RESET}", yes, default=True):
+        print_info("Order cancelled by user")
+        return
     
-    except (ValidationError, BinanceAPIError, CCXTAPIError) as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Order error: {str(e)}")
-        sys.exit(1)
+    print(f"\n{_CYAN}Executing order...{_RESET}")
     
-    except Exception as e:
-        print_error(f"Unexpected Error: {str(e)}")
-        logger.error(f"Unexpected error: {str(e)}")
-        sys.exit(1)
+    # Execute order based on mode
+    if bot.uses_ccxt_api:
+        # Mock and CCXT use create_order
+        response = bot.exchange.create_order(
+            symbol=symbol,
+            order_type='limit',
+            side=side.lower(),
+            amount=quantity,
+            price=price
+        )
+        
+        # Normalize response to match Binance format
+        response = _normalize_order_response(
+            response, symbol, side=side, quantity=quantity,
+            price=price, time_in_force=tif
+        )
+    else:
+        # Binance mode uses order_manager
+        response = bot.order_manager.place_limit_order(
+            symbol, side, quantity, price, tif
+        )
+    
+    # Display order response
+    with _batched_stdout():
+        print(f"\n{_GREEN}{'='*60}{_RESET}")
+        print(f"{_GREEN}✓ ORDER PLACED SUCCESSFULLY{_RESET}")
+        print(f"{_GREEN}{'='*60}{_RESET}")
+        
+        response_data = zip(_LIMIT_RESPONSE_LABELS, (
+            response['orderId'],
+            response['symbol'],
+            response['side'],
+            response['status'],
+            response['quantity'],
+            f"{response['price']:.8f}",
+            response['executedQty'],
+            _fmt_price(response['avgPrice']),
+            response['timeInForce'],
+        ))
+        print(_grid(response_data))
+        
+        print_success(f"Limit order {response['orderId']} placed on {symbol}")
+    logger.info(f"Limit order placed: {response['orderId']}")
 
 
 @cli.command()
-@click.option('--symbol', prompt='Trading symbol (e.g., BTCUSDT or BTC/USDT)', type=str, help='Futures trading pair')
+@click.option('--symbol', prompt='Trading symbol (e.g., BTCUSDT or BTC/USDT)', type=SYMBOL, help='Futures trading pair')
 @click.option('--order-id', prompt='Order ID', type=int, help='Order ID to check')
 @click.pass_context
+@_handle_errors('api')
 def status(ctx, symbol, order_id):
     """
     Check the status of an existing order.
@@ -358,83 +562,52 @@ def status(ctx, symbol, order_id):
     print_header()
     print_info(f"Fetching order status for {symbol} (ID: {order_id})...")
     
-    try:
-        bot = ctx.obj['bot']
-        
-        # Normalize symbol format based on mode
-        if bot.mode in ['mock', 'ccxt']:
-            # CCXT and Mock use BTC/USDT format
-            if '/' not in symbol:
-                # Convert BTCUSDT to BTC/USDT
-                if symbol.endswith('USDT'):
-                    base = symbol[:-4]
-                    symbol = f"{base}/USDT"
-        else:
-            # Binance API uses BTCUSDT format
-            if '/' in symbol:
-                symbol = symbol.replace('/', '')
-        
-        # Fetch order based on mode
-        if bot.mode == 'mock' or bot.mode == 'ccxt':
-            # Mock and CCXT use fetch_order
-            response = bot.exchange.fetch_order(
-                order_id=order_id,
-                symbol=symbol
-            )
-            
-            # Normalize response to match Binance format
-            normalized_response = {
-                'orderId': response.get('id', response.get('orderId', order_id)),
-                'symbol': response.get('symbol', symbol),
-                'side': response.get('side', 'UNKNOWN').upper(),
-                'status': response.get('status', 'UNKNOWN').upper(),
-                'type': response.get('type', 'UNKNOWN').upper(),
-                'quantity': response.get('amount', 0),
-                'executedQty': response.get('filled', 0),
-                'price': response.get('price', 0),
-                'avgPrice': response.get('average', response.get('price', 0)),
-                'timeInForce': response.get('timeInForce', 'N/A'),
-            }
-            response = normalized_response
-        else:
-            # Binance mode uses order_manager
-            response = bot.order_manager.get_order_status(symbol, order_id)
-        
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{Fore.CYAN}Order Status{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
-        
-        status_data = [
-            ['Order ID', response['orderId']],
-            ['Symbol', response['symbol']],
-            ['Side', response['side']],
-            ['Status', response['status']],
-            ['Type', response['type']],
-            ['Quantity', response['quantity']],
-            ['Executed', response['executedQty']],
-            ['Price', f"{response['price']:.8f}" if response['price'] else "N/A"],
-            ['Avg Price', f"{response['avgPrice']:.8f}" if response['avgPrice'] else "N/A"],
-        ]
-        print(tabulate(status_data, tablefmt='grid'))
-        
-        print_success(f"Order {order_id} status retrieved")
+    bot = get_bot(ctx)
     
-    except (BinanceAPIError, CCXTAPIError) as e:
-        print_error(f"API Error: {str(e)}")
-        logger.error(f"API error: {str(e)}")
-        sys.exit(1)
+    # Fetch order based on mode
+    if bot.uses_ccxt_api:
+        # Mock and CCXT use fetch_order
+        response = bot.exchange.fetch_order(
+            order_id=order_id,
+            symbol=symbol
+        )
+        
+        # Normalize response to match Binance format
+        response = _normalize_order_response(
+            response, symbol, order_id=order_id, executed=0
+        )
+    else:
+        # Binance mode uses order_manager
+        response = bot.order_manager.get_order_status(symbol, order_id)
     
-    except Exception as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Error: {str(e)}")
-        sys.exit(1)
+    with _batched_stdout():
+        print(f"\n{_CYAN}{'='*60}{_RESET}")
+        print(f"{_CYAN}Order Status{_RESET}")
+        print(f"{_CYAN}{'='*60}{_RESET}")
+        
+        status_data = zip(_STATUS_LABELS, (
+            response['orderId'],
+            response['symbol'],
+            response['side'],
+            response['status'],
+            response['type'],
+            response['quantity'],
+            response['executedQty'],
+            _fmt_price(response['price']),
+            _fmt_price(response['avgPrice']),
+        ))
+        print(_grid(status_data))
+        
+        print_success(f"Order {order_id} status retrieved")
 
 
 @cli.command()
-@click.option('--symbol', prompt='Trading symbol (e.g., BTCUSDT or BTC/USDT)', type=str, help='Futures trading pair')
+@click.option('--symbol', prompt='Trading symbol (e.g., BTCUSDT or BTC/USDT)', type=SYMBOL, help='Futures trading pair')
 @click.option('--order-id', prompt='Order ID', type=int, help='Order ID to cancel')
+@click.option('--yes', '-y', is_flag=True, default=False, help='Skip the confirmation prompt')
 @click.pass_context
-def cancel(ctx, symbol, order_id):
+@_handle_errors('api')
+def cancel(ctx, symbol, order_id, yes):
     """
     Cancel an open order.
     Works in mock, ccxt, or binance mode based on configuration.
@@ -442,74 +615,46 @@ def cancel(ctx, symbol, order_id):
     print_header()
     print_info(f"Attempting to cancel order {order_id} on {symbol}...")
     
-    # Confirm cancellation
-    if not click.confirm(f"{Fore.YELLOW}Are you sure you want to cancel this order?", default=False):
+    # Confirm cancellation (skipped with --yes or when stdin is not a terminal)
+    if not _confirmed(f"{_YELLOW}Are you sure you want to cancel this order?{_RESET}", yes, default=False):
         print_info("Cancellation aborted")
         return
     
-    try:
-        bot = ctx.obj['bot']
-        
-        # Normalize symbol format based on mode
-        if bot.mode in ['mock', 'ccxt']:
-            # CCXT and Mock use BTC/USDT format
-            if '/' not in symbol:
-                # Convert BTCUSDT to BTC/USDT
-                if symbol.endswith('USDT'):
-                    base = symbol[:-4]
-                    symbol = f"{base}/USDT"
-        else:
-            # Binance API uses BTCUSDT format
-            if '/' in symbol:
-                symbol = symbol.replace('/', '')
-        
-        # Cancel order based on mode
-        if bot.mode == 'mock' or bot.mode == 'ccxt':
-            # Mock and CCXT use cancel_order
-            response = bot.exchange.cancel_order(
-                order_id=order_id,
-                symbol=symbol
-            )
-            
-            # Normalize response to match Binance format
-            normalized_response = {
-                'orderId': response.get('id', response.get('orderId', order_id)),
-                'symbol': response.get('symbol', symbol),
-                'side': response.get('side', 'UNKNOWN').upper(),
-                'status': response.get('status', 'UNKNOWN').upper(),
-            }
-            response = normalized_response
-        else:
-            # Binance mode uses order_manager
-            response = bot.order_manager.cancel_order(symbol, order_id)
-        
-        print(f"\n{Fore.GREEN}{'='*60}")
-        print(f"{Fore.GREEN}✓ ORDER CANCELLED SUCCESSFULLY{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
-        
-        cancel_data = [
-            ['Order ID', response['orderId']],
-            ['Symbol', response['symbol']],
-            ['Status', response['status']],
-            ['Side', response['side']],
-        ]
-        print(tabulate(cancel_data, tablefmt='grid'))
-        
-        print_success(f"Order {order_id} cancelled successfully")
+    bot = get_bot(ctx)
     
-    except (BinanceAPIError, CCXTAPIError) as e:
-        print_error(f"API Error: {str(e)}")
-        logger.error(f"API error: {str(e)}")
-        sys.exit(1)
+    # Cancel order based on mode
+    if bot.uses_ccxt_api:
+        # Mock and CCXT use cancel_order
+        response = bot.exchange.cancel_order(
+            order_id=order_id,
+            symbol=symbol
+        )
+        
+        # Normalize response to match Binance format
+        response = _normalize_order_response(response, symbol, order_id=order_id)
+    else:
+        # Binance mode uses order_manager
+        response = bot.order_manager.cancel_order(symbol, order_id)
     
-    except Exception as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Error: {str(e)}")
-        sys.exit(1)
+    with _batched_stdout():
+        print(f"\n{_GREEN}{'='*60}{_RESET}")
+        print(f"{_GREEN}✓ ORDER CANCELLED SUCCESSFULLY{_RESET}")
+        print(f"{_GREEN}{'='*60}{_RESET}")
+        
+        cancel_data = zip(_CANCEL_LABELS, (
+            response['orderId'],
+            response['symbol'],
+            response['status'],
+            response['side'],
+        ))
+        print(_grid(cancel_data))
+        
+        print_success(f"Order {order_id} cancelled successfully")
 
 
 @cli.command()
 @click.pass_context
+@_handle_errors('api')
 def info(ctx):
     """
     Display account information and balance.
@@ -517,13 +662,13 @@ def info(ctx):
     print_header()
     print_info("Fetching account information...")
     
-    try:
-        client = ctx.obj['bot'].client
-        account = client.get_account_balance()
-        
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{Fore.CYAN}Account Information{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+    client = get_bot(ctx).client
+    account = client.get_account_balance()
+    
+    with _batched_stdout():
+        print(f"\n{_CYAN}{'='*60}{_RESET}")
+        print(f"{_CYAN}Account Information{_RESET}")
+        print(f"{_CYAN}{'='*60}{_RESET}")
         
         # Display key account info
         info_data = [
@@ -531,44 +676,33 @@ def info(ctx):
             ['Max Orders', account.get('maxOrders', 'N/A')],
             ['Max Algo Orders', account.get('maxAlgoOrders', 'N/A')],
         ]
-        print(tabulate(info_data, tablefmt='grid'))
+        print(_grid(info_data))
         
         # Display balances
-        print(f"\n{Fore.CYAN}Balances:")
+        print(f"\n{_CYAN}Balances:{_RESET}")
         if 'assets' in account and account['assets']:
-            balances = []
-            for asset in account['assets']:
-                if float(asset.get('walletBalance', 0)) > 0:
-                    balances.append([
-                        asset['asset'],
-                        float(asset['walletBalance']),
-                        float(asset.get('unrealizedProfit', 0)),
-                    ])
+            # Parse each wallet balance once, for both the filter and the row
+            balances = [
+                [asset['asset'], wallet, float(asset.get('unrealizedProfit', 0))]
+                for asset in account['assets']
+                if (wallet := float(asset.get('walletBalance', 0))) > 0
+            ]
             
             if balances:
-                print(tabulate(
+                print(_grid(
                     balances,
-                    headers=['Asset', 'Wallet Balance', 'Unrealized P&L'],
-                    tablefmt='grid'
+                    headers=['Asset', 'Wallet Balance', 'Unrealized P&L']
                 ))
             else:
                 print_info("No active balances")
         
         print_success("Account information retrieved")
-    
-    except BinanceAPIError as e:
-        print_error(f"API Error: {str(e)}")
-        logger.error(f"API error: {str(e)}")
-        sys.exit(1)
-    
-    except Exception as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Error: {str(e)}")
-        sys.exit(1)
 
 
 @cli.command()
-def test():
+@click.pass_context
+@_handle_errors('connection')
+def test(ctx):
     """
     Test exchange connection.
     Works with mock, ccxt, or binance mode based on configuration.
@@ -576,17 +710,17 @@ def test():
     print_header()
     print_info(f"Testing {config.EXCHANGE_MODE.upper()} mode connection...")
     
-    try:
-        bot = BotContext()
-        
-        if bot.mode == 'mock':
-            # Test mock exchange
-            if bot.exchange.test_connection():
-                balance = bot.exchange.fetch_balance()
-                
-                print(f"\n{Fore.GREEN}{'='*60}")
-                print(f"{Fore.GREEN}✓ MOCK EXCHANGE READY{Style.RESET_ALL}")
-                print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
+    bot = get_bot(ctx)
+    
+    if bot.mode == 'mock':
+        # Test mock exchange
+        if bot.exchange.test_connection():
+            balance = bot.exchange.fetch_balance()
+            
+            with _batched_stdout():
+                print(f"\n{_GREEN}{'='*60}{_RESET}")
+                print(f"{_GREEN}✓ MOCK EXCHANGE READY{_RESET}")
+                print(f"{_GREEN}{'='*60}{_RESET}")
                 
                 test_data = [
                     ['Mode', 'MOCK (Offline)'],
@@ -594,20 +728,21 @@ def test():
                     ['API Calls', 'None (Completely Offline)'],
                     ['USDT Balance', f"${balance['total'].get('USDT', 0):.2f}"],
                 ]
-                print(tabulate(test_data, tablefmt='grid'))
+                print(_grid(test_data))
                 
                 print_success("Mock exchange is ready for testing!")
                 print_info("No API credentials needed in mock mode")
-                logger.info("Mock exchange test successful")
-        
-        elif bot.mode == 'ccxt':
-            # Test CCXT client
-            if bot.client.test_connection():
-                balance = bot.client.fetch_balance()
-                
-                print(f"\n{Fore.GREEN}{'='*60}")
-                print(f"{Fore.GREEN}✓ CCXT CONNECTION SUCCESSFUL{Style.RESET_ALL}")
-                print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
+            logger.info("Mock exchange test successful")
+    
+    elif bot.mode == 'ccxt':
+        # Test CCXT client
+        if bot.client.test_connection():
+            balance = bot.client.fetch_balance()
+            
+            with _batched_stdout():
+                print(f"\n{_GREEN}{'='*60}{_RESET}")
+                print(f"{_GREEN}✓ CCXT CONNECTION SUCCESSFUL{_RESET}")
+                print(f"{_GREEN}{'='*60}{_RESET}")
                 
                 test_data = [
                     ['Mode', 'CCXT'],
@@ -615,39 +750,29 @@ def test():
                     ['Environment', 'LIVE (Real Money!)'],
                     ['USDT Balance', f"${balance['total'].get('USDT', 0):.2f}"],
                 ]
-                print(tabulate(test_data, tablefmt='grid'))
+                print(_grid(test_data))
                 
                 print_success("CCXT connection is working!")
-                logger.info("CCXT connection test successful")
-        
-        else:
-            # Test Binance client
-            account = bot.client.get_account_balance()
-            
-            print(f"\n{Fore.GREEN}{'='*60}")
-            print(f"{Fore.GREEN}✓ CONNECTION SUCCESSFUL{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}")
+            logger.info("CCXT connection test successful")
+    
+    else:
+        # Test Binance client
+        account = bot.client.get_account_balance()
+        
+        with _batched_stdout():
+            print(f"\n{_GREEN}{'='*60}{_RESET}")
+            print(f"{_GREEN}✓ CONNECTION SUCCESSFUL{_RESET}")
+            print(f"{_GREEN}{'='*60}{_RESET}")
             
             test_data = [
                 ['Mode', 'BINANCE'],
                 ['Account Type', account.get('accountType', 'N/A')],
                 ['API Key Status', '✓ Valid'],
             ]
-            print(tabulate(test_data, tablefmt='grid'))
+            print(_grid(test_data))
             
             print_success("API credentials are valid and connection is working")
-            logger.info("API connection test successful")
-    
-    except (BinanceAPIError, CCXTAPIError) as e:
-        print_error(f"API Error: {str(e)}")
-        print_info("Please check your API credentials in .env file")
-        logger.error(f"API connection test failed: {str(e)}")
-        sys.exit(1)
-    
-    except Exception as e:
-        print_error(f"Error: {str(e)}")
-        logger.error(f"Connection test error: {str(e)}")
-        sys.exit(1)
+        logger.info("API connection test successful")
 
 
 if __name__ == '__main__':
@@ -3,18 +3,46 @@ Modern configuration module with multiple authentication options.
 Supports interactive input, environment variables, and config files.
 """
 import os
+import sys
 import json
+import getpass
+import functools
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
-# Load .env file for environment variables
-load_dotenv()
-from dotenv import load_dotenv
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
 
 # Load .env file for environment variables
 load_dotenv()
 
+# Read-only snapshot of the variables this module uses, taken once after .env
+# has been loaded
+_ENV = MappingProxyType({
+    name: os.environ.get(name, "")
+    for name in ("EXCHANGE_MODE", "BINANCE_API_KEY", "BINANCE_API_SECRET", "CCXT_SANDBOX_MODE")
+})
+
+_STDIN_IS_TTY = sys.stdin is not None and sys.stdin.isatty()
+
+CONFIG_FILE = Path("trading_bot_config.json")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_json() -> Dict[str, Any]:
+    """Read trading_bot_config.json once; returns {} if missing or unreadable."""
+    try:
+        with open(CONFIG_FILE, 'rb') as f:
+            config = json_loads(f.read())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
 # ============================================================================
 # EXCHANGE MODE CONFIGURATION
 # ============================================================================
@@ -22,24 +50,18 @@ load_dotenv()
 def get_exchange_mode() -> str:
     """Get exchange mode with multiple fallback options."""
     # 1. Check environment variable
-    mode = os.getenv("EXCHANGE_MODE")
-    if mode and mode.lower() in ["mock", "ccxt", "binance"]:
-        return mode.lower()
+    mode = _ENV["EXCHANGE_MODE"].lower()
+    if mode in ["mock", "ccxt", "binance"]:
+        return mode
     
     # 2. Check for API keys in environment
-    if os.getenv("BINANCE_API_KEY") and os.getenv("BINANCE_API_SECRET"):
+    if _ENV["BINANCE_API_KEY"] and _ENV["BINANCE_API_SECRET"]:
         return "ccxt"
     
     # 3. Check config file
-    config_file = Path("trading_bot_config.json")
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-                if "exchange_mode" in config and config["exchange_mode"] in ["mock", "ccxt", "binance"]:
-                    return config["exchange_mode"]
-        except (json.JSONDecodeError, KeyError):
-            pass
+    config_mode = _load_config_json().get("exchange_mode")
+    if config_mode in ["mock", "ccxt", "binance"]:
+        return config_mode
     
     # 4. Default to mock mode (safest option)
     return "mock"
@@ -51,6 +73,7 @@ EXCHANGE_MODE = get_exchange_mode()
 # ============================================================================
 class APIConfig:
     """API configuration with multiple authentication methods."""
+    __slots__ = ('api_key', 'api_secret')
     
     def __init__(self):
         self.api_key = ""
@@ -64,42 +87,41 @@ class APIConfig:
         3. Interactive input (if needed)
         """
         # Try environment variables first
-        self.api_key = os.getenv("BINANCE_API_KEY", "")
-        self.api_secret = os.getenv("BINANCE_API_SECRET", "")
+        self.api_key = _ENV["BINANCE_API_KEY"]
+        self.api_secret = _ENV["BINANCE_API_SECRET"]
         
         if self.api_key and self.api_secret:
             return
         
-        # Try config file
-        config_file = Path("trading_bot_config.json")
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    self.api_key = config.get("api_key", "")
-                    self.api_secret = config.get("api_secret", "")
-                    if self.api_key and self.api_secret:
-                        return
-            except (json.JSONDecodeError, KeyError):
-                pass
-        
-        # For mock mode, credentials aren't needed
-        if EXCHANGE_MODE == "mock":
+        # Try config file; key and secret are taken from it as a pair, never
+        # mixed with a partial set from the environment. This runs in mock
+        # mode too, so `info` reports file credentials as configured
+        config = _load_config_json()
+        file_key = config.get("api_key", "")
+        file_secret = config.get("api_secret", "")
+        if file_key and file_secret:
+            self.api_key, self.api_secret = file_key, file_secret
             return
-            
-        # For real modes, we can prompt interactively if running in CLI context
-        # This will be handled by the CLI when needed
+        
+        # Mock mode needs no credentials; real modes have anything still
+        # missing prompted for by the CLI when needed
     
     def get_credentials(self) -> tuple[str, str]:
         """Get API credentials, prompting interactively if missing and in CLI context."""
         return self.api_key, self.api_secret
     
-    def prompt_for_credentials(self) -> None:
-        """Prompt user for API credentials interactively."""
-        if not self.api_key:
-            self.api_key = input("Enter Binance API Key: ").strip()
-        if not self.api_secret:
-            self.api_secret = input("Enter Binance API Secret: ").strip()
+    def prompt_for_credentials(self) -> tuple[str, str]:
+        """Prompt user for missing API credentials without echoing them.
+        
+        Without a terminal on stdin (e.g. CI) nothing is prompted, so the
+        caller fails fast on the missing values instead of blocking.
+        """
+        if _STDIN_IS_TTY:
+            if not self.api_key:
+                self.api_key = getpass.getpass("Enter Binance API Key: ").strip()
+            if not self.api_secret:
+                self.api_secret = getpass.getpass("Enter Binance API Secret: ").strip()
+        return self.api_key, self.api_secret
 
 # Global API configuration instance
 API_CONFIG = APIConfig()
@@ -128,7 +150,7 @@ MIN_ORDER_QUANTITY = 0.001
 def get_sandbox_mode() -> bool:
     """Get sandbox mode setting."""
     # Note: Binance removed futures sandbox, but we keep this for CCXT compatibility
-    sandbox = os.getenv("CCXT_SANDBOX_MODE", "").lower()
+    sandbox = _ENV["CCXT_SANDBOX_MODE"].lower()
     if sandbox in ["true", "1", "yes"]:
         return True
     elif sandbox in ["false", "0", "no"]:
@@ -4,8 +4,117 @@ This demonstrates both approaches:
 1. MockExchange - Completely offline, no API calls (RECOMMENDED FOR TESTING)
 2. CCXTClient - For live trading with real Binance API
 """
+import sys
+import time
 from trading_bot.bot.mock_exchange import MockExchange
-from trading_bot.bot import CCXTClient, CCXTAPIError
+
+_RULE = "=" * 70
+_DASHES_40 = "-" * 40
+_DASHES_60 = "-" * 60
+_DASHES_80 = "-" * 80
+
+
+def _clock_labels(timestamps_ms):
+    """
+    Local HH:MM:SS labels for millisecond timestamps.
+    
+    The UTC offset is looked up once when the whole range shares it, so each
+    label is integer arithmetic instead of a datetime plus strftime.
+    """
+    secs = [ts // 1000 for ts in timestamps_ms]
+    if not secs:
+        return []
+    offset = time.localtime(secs[0]).tm_gmtoff
+    if time.localtime(secs[-1]).tm_gmtoff != offset:  # range crosses a DST change
+        return [time.strftime('%H:%M:%S', time.localtime(s)) for s in secs]
+    return [
+        f"{s // 3600 % 24:02d}:{s // 60 % 60:02d}:{s % 60:02d}"
+        for s in (s + offset for s in secs)
+    ]
+
+# Static text blocks, each printed with a single write
+
+_PIPELINE_BANNER = f"""
+{_RULE}
+RECOMMENDED TESTING PIPELINE
+{_RULE}
+
+Step 1: UNIT TEST with MockExchange
+  - Test order placement logic
+  - Test balance updates
+  - Test error handling
+  - No API calls, instant feedback
+
+Step 2: INTEGRATION TEST with MockExchange
+  - Test strategy execution
+  - Test signal generation
+  - Test portfolio tracking
+  - Still completely offline
+
+Step 3: PAPER TRADING with Live API (Future)
+  - Connect to real Binance API
+  - Send orders but with read-only permissions first
+  - Monitor for 24+ hours
+  - Verify all data flows correctly
+
+Step 4: LIVE TRADING (After All Tests Pass)
+  - Start with SMALL order sizes
+  - Monitor continuously
+  - Have kill-switch ready
+  - Scale up gradually
+    
+"""
+
+_MOCK_VS_LIVE_BANNER = f"""
+{_RULE}
+MOCK EXCHANGE vs LIVE CCXT CLIENT
+{_RULE}
+
+╔════════════════════════════════════════════════════════════════╗
+║              MOCK EXCHANGE (RECOMMENDED FOR TESTING)           ║
+╠════════════════════════════════════════════════════════════════╣
+║ ✓ No API calls (completely offline)                           ║
+║ ✓ Zero API costs                                               ║
+║ ✓ Instant order execution                                     ║
+║ ✓ Predictable test data                                       ║
+║ ✓ Perfect for development & testing                          ║
+║ ✓ No internet required                                         ║
+║                                                                ║
+║ Usage:                                                          ║
+║   from trading_bot.bot.mock_exchange import MockExchange      ║
+║   exchange = MockExchange()                                   ║
+╚════════════════════════════════════════════════════════════════╝
+
+╔════════════════════════════════════════════════════════════════╗
+║           LIVE CCXT CLIENT (FOR PRODUCTION TRADING)            ║
+╠════════════════════════════════════════════════════════════════╣
+║ ⚠ Real Binance API calls                                        ║
+║ ⚠ Real money traded                                            ║
+║ ⚠ Requires valid API keys                                      ║
+║ ⚠ Subject to Binance rate limits                              ║
+║ ⚠ Use only after extensive testing                           ║
+║ ⚠ Requires proper safeguards & monitoring                    ║
+║                                                                ║
+║ Usage:                                                          ║
+║   from trading_bot.bot import CCXTClient                      ║
+║   client = CCXTClient()  # Uses BINANCE_API_KEY from .env    ║
+╚════════════════════════════════════════════════════════════════╝
+"""
+
+_SUMMARY_BANNER = f"""
+{_RULE}
+Examples completed! [check mark]
+{_RULE}
+
+Key Takeaways:
+• MockExchange = Perfect for testing (no API calls, completely offline)
+• Use MockExchange for all development & testing
+• Only use CCXTClient when you're ready for LIVE trading
+• Always start with small live orders after extensive mock testing
+• Monitor logs and have kill-switch ready
+{_RULE}
+
+"""
 
 # ============================================================================
 # EXAMPLE 1: Mock Exchange Connection Test (RECOMMENDED)
@@ -15,9 +124,7 @@ def example_mock_connection():
     Connect to mock exchange - completely offline, no API calls.
     PERFECT for testing without any internet or API cost!
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 1: Mock Exchange Connection Test (OFFLINE ✓)")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 1: Mock Exchange Connection Test (OFFLINE ✓)\n{_RULE}")
     
     exchange = MockExchange()
     
@@ -39,15 +146,13 @@ def example_mock_fetch_balance():
     Fetch account balance from mock exchange.
     This is completely predictable - perfect for testing!
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 2: Fetch Mock Account Balance")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 2: Fetch Mock Account Balance\n{_RULE}")
     
     exchange = MockExchange()
     balance = exchange.fetch_balance()
     
     print("\nMock Account Balance:")
-    print("-" * 40)
+    print(_DASHES_40)
     
     for symbol in ['USDT', 'BTC', 'ETH', 'BNB']:
         if symbol in balance['total']:
@@ -65,9 +170,7 @@ def example_mock_market_order():
     Create a market order in mock exchange (instant execution).
     Perfect for testing order logic without risks!
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 3: Create Mock Market Order (Instant ✓)")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 3: Create Mock Market Order (Instant ✓)\n{_RULE}")
     
     exchange = MockExchange()
     
@@ -101,9 +204,7 @@ def example_mock_limit_order():
     Create a limit order in mock exchange.
     Test pending orders and cancellation logic!
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 4: Create Mock Limit Order (Pending)")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 4: Create Mock Limit Order (Pending)\n{_RULE}")
     
     exchange = MockExchange()
     
@@ -138,9 +239,7 @@ def example_mock_cancel_order():
     Create and then cancel a limit order.
     Test order lifecycle management!
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 5: Create & Cancel Mock Order")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 5: Create & Cancel Mock Order\n{_RULE}")
     
     exchange = MockExchange()
     
@@ -173,20 +272,21 @@ def example_mock_fetch_ticker():
     """
     Fetch current ticker (price) data from mock exchange.
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 6: Fetch Mock Market Prices")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 6: Fetch Mock Market Prices\n{_RULE}")
     
     exchange = MockExchange()
     
     symbols = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT']
     
     print("\nCurrent Mock Prices:")
-    print("-" * 60)
+    print(_DASHES_60)
     
-    for symbol in symbols:
-        ticker = exchange.fetch_ticker(symbol)
-        print(f"{symbol:10} | Bid: ${ticker['bid']:12,.2f} | Ask: ${ticker['ask']:12,.2f}")
+    # One call for all symbols, then one write for all rows
+    tickers = exchange.fetch_tickers(symbols)
+    sys.stdout.write("".join(
+        f"{symbol:10} | Bid: ${tickers[symbol]['bid']:12,.2f} | Ask: ${tickers[symbol]['ask']:12,.2f}\n"
+        for symbol in symbols
+    ))
 
 
 # ============================================================================
@@ -196,9 +296,7 @@ def example_mock_fetch_ohlcv():
     """
     Fetch OHLCV (candlestick) data for technical analysis.
     """
-    print("\n" + "="*70)
-    print("EXAMPLE 7: Fetch Mock OHLCV Candlestick Data")
-    print("="*70)
+    print(f"\n{_RULE}\nEXAMPLE 7: Fetch Mock OHLCV Candlestick Data\n{_RULE}")
     
     exchange = MockExchange()
     
@@ -210,15 +308,18 @@ def example_mock_fetch_ohlcv():
     )
     
     print(f"\nBTC/USDT - Last 5 1H Candles:")
-    print("-" * 80)
+    print(_DASHES_80)
     print(f"{'Time':<12} | {'Open':>10} | {'High':>10} | {'Low':>10} | {'Close':>10}")
-    print("-" * 80)
+    print(_DASHES_80)
     
-    from datetime import datetime
-    for candle in candles:
-        timestamp = datetime.fromtimestamp(candle[0]/1000).strftime('%H:%M:%S')
-        open_p, high, low, close = candle[1:5]
-        print(f"{timestamp:<12} | {open_p:>10.2f} | {high:>10.2f} | {low:>10.2f} | {close:>10.2f}")
+    # Format every row first, then emit them with one write
+    labels = _clock_labels([candle[0] for candle in candles])
+    rows = [
+        f"{label:<12} | "
+        f"{open_p:>10.2f} | {high:>10.2f} | {low:>10.2f} | {close:>10.2f}\n"
+        for label, (_ts, open_p, high, low, close, _volume) in zip(labels, candles)
+    ]
+    sys.stdout.write("".join(rows))
 
 
 # ============================================================================
@@ -228,39 +329,7 @@ def example_mock_vs_live():
     """
     Comparison of mock exchange vs live trading.
     """
-    print("\n" + "="*70)
-    print("MOCK EXCHANGE vs LIVE CCXT CLIENT")
-    print("="*70)
-    
-    print("\n╔════════════════════════════════════════════════════════════════╗")
-    print("║              MOCK EXCHANGE (RECOMMENDED FOR TESTING)           ║")
-    print("╠════════════════════════════════════════════════════════════════╣")
-    print("║ ✓ No API calls (completely offline)                           ║")
-    print("║ ✓ Zero API costs                                               ║")
-    print("║ ✓ Instant order execution                                     ║")
-    print("║ ✓ Predictable test data                                       ║")
-    print("║ ✓ Perfect for development & testing                          ║")
-    print("║ ✓ No internet required                                         ║")
-    print("║                                                                ║")
-    print("║ Usage:                                                          ║")
-    print("║   from trading_bot.bot.mock_exchange import MockExchange      ║")
-    print("║   exchange = MockExchange()                                   ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
-    
-    print("\n╔════════════════════════════════════════════════════════════════╗")
-    print("║           LIVE CCXT CLIENT (FOR PRODUCTION TRADING)            ║")
-    print("╠════════════════════════════════════════════════════════════════╣")
-    print("║ ⚠ Real Binance API calls                                        ║")
-    print("║ ⚠ Real money traded                                            ║")
-    print("║ ⚠ Requires valid API keys                                      ║")
-    print("║ ⚠ Subject to Binance rate limits                              ║")
-    print("║ ⚠ Use only after extensive testing                           ║")
-    print("║ ⚠ Requires proper safeguards & monitoring                    ║")
-    print("║                                                                ║")
-    print("║ Usage:                                                          ║")
-    print("║   from trading_bot.bot import CCXTClient                      ║")
-    print("║   client = CCXTClient()  # Uses BINANCE_API_KEY from .env    ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
+    sys.stdout.write(_MOCK_VS_LIVE_BANNER)
 
 
 # ============================================================================
@@ -270,43 +339,13 @@ def show_testing_pipeline():
     """
     Recommended pipeline for safe bot development.
     """
-    print("\n" + "="*70)
-    print("RECOMMENDED TESTING PIPELINE")
-    print("="*70)
-    
-    print("""
-Step 1: UNIT TEST with MockExchange
-  - Test order placement logic
-  - Test balance updates
-  - Test error handling
-  - No API calls, instant feedback
-
-Step 2: INTEGRATION TEST with MockExchange
-  - Test strategy execution
-  - Test signal generation
-  - Test portfolio tracking
-  - Still completely offline
-
-Step 3: PAPER TRADING with Live API (Future)
-  - Connect to real Binance API
-  - Send orders but with read-only permissions first
-  - Monitor for 24+ hours
-  - Verify all data flows correctly
-
-Step 4: LIVE TRADING (After All Tests Pass)
-  - Start with SMALL order sizes
-  - Monitor continuously
-  - Have kill-switch ready
-  - Scale up gradually
-    """)
+    sys.stdout.write(_PIPELINE_BANNER)
 
 # ============================================================================
 # Main Entry Point
 # ============================================================================
 if __name__ == "__main__":
-    print("\n" + "="*70)
-    print("MOCK EXCHANGE & CCXT - TRADING BOT EXAMPLES")
-    print("="*70)
+    print(f"\n{_RULE}\nMOCK EXCHANGE & CCXT - TRADING BOT EXAMPLES\n{_RULE}")
     
     show_testing_pipeline()
     
@@ -320,13 +359,4 @@ if __name__ == "__main__":
     example_mock_cancel_order()
     example_mock_vs_live()
     
-    print("\n" + "="*70)
-    print("Examples completed! [check mark]")
-    print("="*70)
-    print("\nKey Takeaways:")
-    print("• MockExchange = Perfect for testing (no API calls, completely offline)")
-    print("• Use MockExchange for all development & testing")
-    print("• Only use CCXTClient when you're ready for LIVE trading")
-    print("• Always start with small live orders after extensive mock testing")
-    print("• Monitor logs and have kill-switch ready")
-    print("="*70 + "\n")
+    sys.stdout.write(_SUMMARY_BANNER)
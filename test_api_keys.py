@@ -2,31 +2,35 @@
 """
 Test script to verify if Binance API keys are working properly.
 """
-import os
+import io
 import sys
-import requests
-from dotenv import load_dotenv
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from test_api_keys_advanced import get_http_session, get_public_ip, json_loads, load_config
 
-# Load environment variables
-load_dotenv()
+# requests and ccxt are imported inside the checks that use them
 
-def test_ccxt_api():
-    """Test API keys using CCXT library with sandbox support."""
+def test_ccxt_api(out=print):
+    """Test API keys using CCXT library with sandbox support.
+    
+    Messages go through out (print by default) so the check can run in a
+    worker thread with its output collected separately.
+    """
     try:
         import ccxt
         
-        api_key = os.getenv("BINANCE_API_KEY", "")
-        api_secret = os.getenv("BINANCE_API_SECRET", "")
-        sandbox_mode = os.getenv("CCXT_SANDBOX_MODE", "True").lower() in ("true", "1", "yes")
+        cfg = load_config("True")
+        api_key, api_secret = cfg.api_key, cfg.api_secret
+        sandbox_mode = cfg.sandbox_mode
         
-        print(f"Testing Binance API Keys with CCXT (Sandbox: {sandbox_mode})...")
-        print("=" * 60)
-        print(f"API Key (first 10 chars): {api_key[:10]}...")
-        print(f"API Secret (first 10 chars): {api_secret[:10]}...")
-        print("=" * 60)
+        out(f"Testing Binance API Keys with CCXT (Sandbox: {sandbox_mode})...")
+        out("=" * 60)
+        out(f"API Key (first 10 chars): {api_key[:10]}...")
+        out(f"API Secret (first 10 chars): {api_secret[:10]}...")
+        out("=" * 60)
         
         if not api_key or not api_secret:
-            print("ERROR: API keys are not set in .env file!")
+            out("ERROR: API keys are not set in .env file!")
             return False
         
         # Initialize CCXT Binance exchange
@@ -34,6 +38,7 @@ def test_ccxt_api():
             'apiKey': api_key,
             'secret': api_secret,
             'enableRateLimit': True,
+            'timeout': 10000,  # ms, same bound as the REST check
             'options': {
                 'defaultType': 'future',
             }
@@ -42,135 +47,139 @@ def test_ccxt_api():
         exchange = ccxt.binance(exchange_config)
         
         if sandbox_mode:
-            print("Enabling Sandbox Mode (Testnet)...")
+            out("Enabling Sandbox Mode (Testnet)...")
             exchange.set_sandbox_mode(True)
         else:
-            print("Using LIVE Mode (Mainnet)...")
+            out("Using LIVE Mode (Mainnet)...")
         
         # Test 1: Fetch balance
-        print("\nTest 1: Fetching account balance...")
+        out("\nTest 1: Fetching account balance...")
         try:
             balance = exchange.fetch_balance()
-            print("SUCCESS: API keys are WORKING!")
-            print(f"\nAccount Balance Type: {exchange.options.get('defaultType', 'N/A')}")
+            out("SUCCESS: API keys are WORKING!")
+            out(f"\nAccount Balance Type: {exchange.options.get('defaultType', 'N/A')}")
             
             # Display USDT balance and total
             if 'USDT' in balance:
                 usdt = balance['USDT']
-                print(f"   USDT Free: {usdt.get('free', 0)}")
-                print(f"   USDT Used: {usdt.get('used', 0)}")
-                print(f"   USDT Total: {usdt.get('total', 0)}")
+                out(f"   USDT Free: {usdt.get('free', 0)}")
+                out(f"   USDT Used: {usdt.get('used', 0)}")
+                out(f"   USDT Total: {usdt.get('total', 0)}")
             else:
-                print("   No USDT balance found (account might be empty or wrong type)")
+                out("   No USDT balance found (account might be empty or wrong type)")
             
-            print("\nAPI Connection: VALID AND WORKING")
+            out("\nAPI Connection: VALID AND WORKING")
             return True
             
         except Exception as e:
             error_msg = str(e)
-            print(f"FAILED: {error_msg}")
+            out(f"FAILED: {error_msg}")
 
             # More detailed handling for the common Binance -2015 error
             if "-2015" in error_msg or "Invalid API-key" in error_msg or "permissions" in error_msg.lower():
-                print("\nIssue: Invalid API-key, IP, or permissions for action (Binance -2015)")
-                print("   Likely causes and fixes:")
-                print("   1) IP restriction: Add your public IP to the key's IP whitelist.")
-                print("   2) Mainnet vs Testnet mismatch: Ensure you're using Testnet keys when sandbox mode is ON.")
-                print(f"      Current Sandbox setting: {'ON' if sandbox_mode else 'OFF'}")
-                print("   3) Missing permissions: Enable 'Futures' in API settings.")
-                try:
-                    public_ip = requests.get('https://api.ipify.org', timeout=3).text
-                    print(f"   Your public IP (detected): {public_ip}")
-                except Exception:
-                    print("   Your public IP: Unable to detect automatically")
-                print("\n   Quick actions:")
-                print("     - Open Binance API Management and edit the key 'jawad123'")
-                print("     - Add your public IP or use Testnet keys for testing")
-                print("     - If you're unsure, run: python SETUP_API_KEY.py for a complete guide")
+                out("\nIssue: Invalid API-key, IP, or permissions for action (Binance -2015)")
+                out("   Likely causes and fixes:")
+                out("   1) IP restriction: Add your public IP to the key's IP whitelist.")
+                out("   2) Mainnet vs Testnet mismatch: Ensure you're using Testnet keys when sandbox mode is ON.")
+                out(f"      Current Sandbox setting: {'ON' if sandbox_mode else 'OFF'}")
+                out("   3) Missing permissions: Enable 'Futures' in API settings.")
+                public_ip = get_public_ip()
+                if public_ip:
+                    out(f"   Your public IP (detected): {public_ip}")
+                else:
+                    out("   Your public IP: Unable to detect automatically")
+                out("\n   Quick actions:")
+                out("     - Open Binance API Management and edit the key 'jawad123'")
+                out("     - Add your public IP or use Testnet keys for testing")
+                out("     - If you're unsure, run: python SETUP_API_KEY.py for a complete guide")
 
             elif "401" in error_msg or "unauthorized" in error_msg.lower():
-                print("\nIssue: Invalid API Key or Secret (Unauthorized)")
+                out("\nIssue: Invalid API Key or Secret (Unauthorized)")
             elif "403" in error_msg or "forbidden" in error_msg.lower():
-                print("\nIssue: Forbidden (Check permissions)")
+                out("\nIssue: Forbidden (Check permissions)")
 
             return False
     
     except ImportError:
-        print("ERROR: CCXT library not installed")
+        out("ERROR: CCXT library not installed")
         return False
 
-def test_binance_rest_api():
-    """Test API keys using Binance REST API with dynamic URL."""
+def test_binance_rest_api(out=print):
+    """Test API keys using Binance REST API with dynamic URL.
+    
+    Messages go through out, as in test_ccxt_api.
+    """
     try:
         import requests
         import hmac
-        import hashlib
         import time
         
-        api_key = os.getenv("BINANCE_API_KEY", "")
-        api_secret = os.getenv("BINANCE_API_SECRET", "")
-        sandbox_mode = os.getenv("CCXT_SANDBOX_MODE", "True").lower() in ("true", "1", "yes")
+        cfg = load_config("True")
+        api_key, api_secret = cfg.api_key, cfg.api_secret
+        sandbox_mode = cfg.sandbox_mode
         
         # Choose base URL based on sandbox mode
         if sandbox_mode:
             base_url = "https://testnet.binancefuture.com"
-            print(f"\nTest 2: Using Binance REST API (TESTNET)...")
+            out(f"\nTest 2: Using Binance REST API (TESTNET)...")
         else:
             base_url = "https://fapi.binance.com"
-            print(f"\nTest 2: Using Binance REST API (MAINNET)...")
+            out(f"\nTest 2: Using Binance REST API (MAINNET)...")
             
-        print("=" * 60)
+        out("=" * 60)
         
         timestamp = int(time.time() * 1000)
         params = f"timestamp={timestamp}"
         
-        signature = hmac.new(
-            api_secret.encode(),
-            params.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        # One-shot HMAC runs entirely inside OpenSSL (SHA extensions where
+        # the CPU has them) without building an HMAC object
+        signature = hmac.digest(api_secret.encode(), params.encode(), 'sha256').hex()
         
         url = f"{base_url}/fapi/v2/account"
         headers = {"X-MBX-APIKEY": api_key}
         
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 url,
                 params={'timestamp': timestamp, 'signature': signature},
                 headers=headers,
-                timeout=10
+                timeout=(3.05, 10)
             )
             
             if response.status_code == 200:
-                print("SUCCESS: REST API authentication WORKING!")
-                data = response.json()
-                print(f"\nAccount Details:")
-                print(f"   Can Trade: {data.get('canTrade', 'N/A')}")
-                print(f"   Account Type: {data.get('accountType', 'N/A')}")
+                out("SUCCESS: REST API authentication WORKING!")
+                data = json_loads(response.content)
+                out(f"\nAccount Details:")
+                out(f"   Can Trade: {data.get('canTrade', 'N/A')}")
+                out(f"   Account Type: {data.get('accountType', 'N/A')}")
                 return True
             else:
-                print(f"FAILED: Status Code {response.status_code}")
-                print(f"   Response: {response.text}")
+                out(f"FAILED: Status Code {response.status_code}")
+                out(f"   Response: {response.text}")
                 if "-2015" in response.text:
-                    print("   Hint: Check 'Enable Futures' in API settings or match Mainnet/Testnet keys.")
+                    out("   Hint: Check 'Enable Futures' in API settings or match Mainnet/Testnet keys.")
                 return False
         except requests.exceptions.RequestException as e:
-            print(f"Network Error: {e}")
+            out(f"Network Error: {e}")
             return False
             
     except Exception as e:
-        print(f"REST API Test Error: {e}")
+        out(f"REST API Test Error: {e}")
         return False
 
 if __name__ == "__main__":
-    import requests # Ensure requests is available for IP check
+    from dotenv import load_dotenv
+    
+    # Load environment variables
+    load_dotenv()
     print("\n" + "=" * 60)
     print("TRADING BOT - API KEY VALIDATION TEST")
     print("=" * 60 + "\n")
     
     # Check current exchange mode
-    exchange_mode = os.getenv("EXCHANGE_MODE", "mock").lower()
-    sandbox_mode = os.getenv("CCXT_SANDBOX_MODE", "True").lower() in ("true", "1", "yes")
+    cfg = load_config("True")
+    exchange_mode = cfg.exchange_mode
+    sandbox_mode = cfg.sandbox_mode
     
     print(f"Current EXCHANGE_MODE: {exchange_mode}")
     print(f"Current SANDBOX_MODE: {sandbox_mode}")
@@ -180,9 +189,17 @@ if __name__ == "__main__":
         print("   API keys will be tested, but the bot is using MockExchange")
         print("\n")
     
-    # Run tests
-    ccxt_result = test_ccxt_api()
-    rest_result = test_binance_rest_api()
+    # Run both checks concurrently; each collects its own output, which is
+    # printed in a fixed order once that check has finished
+    ccxt_out, rest_out = io.StringIO(), io.StringIO()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ccxt_future = pool.submit(test_ccxt_api, functools.partial(print, file=ccxt_out))
+        rest_future = pool.submit(test_binance_rest_api, functools.partial(print, file=rest_out))
+        
+        ccxt_result = ccxt_future.result()
+        sys.stdout.write(ccxt_out.getvalue())
+        rest_result = rest_future.result()
+        sys.stdout.write(rest_out.getvalue())
     
     # Summary
     print("\n" + "=" * 60)
@@ -6,26 +6,114 @@ Detects your public IP and provides actionable fixes
 import os
 import sys
 import json
-from dotenv import load_dotenv
+import time
+import functools
+import ipaddress
+import urllib.request
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-load_dotenv()
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
 
-def get_public_ip():
-    """Detect public IP address"""
+# Services that answer with the caller's public IP as plain text
+_IP_MIRRORS = ('https://api.ipify.org', 'https://ifconfig.me/ip', 'https://icanhazip.com')
+
+# Public IP cache shared with DIAGNOSE_API_ISSUE.py: one plain-text file,
+# trusted for PUBLIC_IP_TTL seconds after it was written
+PUBLIC_IP_TTL = 600
+PUBLIC_IP_CACHE_FILE = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "trading-bot" / "last_public_ip"
+
+# Values of CCXT_SANDBOX_MODE that turn the testnet on
+_TRUTHY = frozenset(("true", "1", "yes"))
+
+@dataclass(frozen=True)
+class Config:
+    """Diagnostic settings, parsed once from the environment"""
+    sandbox_mode: bool
+    exchange_mode: str
+    api_key: str
+    api_secret: str
+
+@functools.lru_cache(maxsize=2)
+def load_config(sandbox_default="False"):
+    """Read the settings after load_dotenv() has run; cached per sandbox default"""
+    return Config(
+        sandbox_mode=os.getenv("CCXT_SANDBOX_MODE", sandbox_default).lower() in _TRUTHY,
+        exchange_mode=os.getenv("EXCHANGE_MODE", "mock").lower(),
+        api_key=os.getenv("BINANCE_API_KEY", "").strip(),
+        api_secret=os.getenv("BINANCE_API_SECRET", "").strip()
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """Shared keep-alive session for the diagnostic requests, created on first use"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    ))
+    return session
+
+def _fetch_ip(url, timeout):
+    """Ask one mirror for the public IP; raises if the answer is not an IP"""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        ip = response.read().decode('utf-8').strip()
+    ipaddress.ip_address(ip)
+    return ip
+
+def read_cached_ip(ttl=PUBLIC_IP_TTL):
+    """Return the IP saved by a previous run if it is younger than ttl seconds"""
     try:
-        import socket
-        import urllib.request
-        ip = urllib.request.urlopen('https://api.ipify.org').read().decode('utf-8')
+        if time.time() - PUBLIC_IP_CACHE_FILE.stat().st_mtime < ttl:
+            return PUBLIC_IP_CACHE_FILE.read_text(encoding='utf-8').strip() or None
+    except OSError:
+        pass
+    return None
+
+def write_cached_ip(ip):
+    """Save the IP for later runs; the cache is best-effort"""
+    try:
+        PUBLIC_IP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PUBLIC_IP_CACHE_FILE.write_text(ip, encoding='utf-8')
+    except OSError:
+        pass
+
+def get_public_ip(ttl=PUBLIC_IP_TTL, timeout=2):
+    """Detect public IP address, reusing a result cached on disk for ttl seconds"""
+    ip = read_cached_ip(ttl)
+    if ip:
         return ip
-    except:
-        return None
+    
+    # Ask all mirrors at once and take the first valid answer
+    pool = ThreadPoolExecutor(max_workers=len(_IP_MIRRORS))
+    try:
+        futures = [pool.submit(_fetch_ip, url, timeout) for url in _IP_MIRRORS]
+        for future in as_completed(futures):
+            if future.exception() is None:
+                ip = future.result()
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    if ip:
+        write_cached_ip(ip)
+    return ip
 
 def check_env_credentials():
     """Verify credentials are loaded from .env"""
-    api_key = os.getenv("BINANCE_API_KEY", "").strip()
-    api_secret = os.getenv("BINANCE_API_SECRET", "").strip()
-    sandbox = os.getenv("CCXT_SANDBOX_MODE", "False").lower() in ("true", "1", "yes")
-    exchange_mode = os.getenv("EXCHANGE_MODE", "mock").lower()
+    cfg = load_config()
+    api_key, api_secret = cfg.api_key, cfg.api_secret
+    sandbox = cfg.sandbox_mode
+    exchange_mode = cfg.exchange_mode
     
     print("\n" + "=" * 70)
     print("🔍 CONFIGURATION CHECK")
@@ -48,14 +136,12 @@ def check_env_credentials():
 def test_api_with_requests():
     """Test API key using raw requests"""
     try:
-        import requests
         import hmac
-        import hashlib
         import time
         
-        api_key = os.getenv("BINANCE_API_KEY", "").strip()
-        api_secret = os.getenv("BINANCE_API_SECRET", "").strip()
-        sandbox = os.getenv("CCXT_SANDBOX_MODE", "False").lower() in ("true", "1", "yes")
+        cfg = load_config()
+        api_key, api_secret = cfg.api_key, cfg.api_secret
+        sandbox = cfg.sandbox_mode
         
         # Determine endpoint
         if sandbox:
@@ -71,11 +157,8 @@ def test_api_with_requests():
         timestamp = int(time.time() * 1000)
         query_string = f"timestamp={timestamp}"
         
-        signature = hmac.new(
-            api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        # hmac.digest is OpenSSL's one-shot HMAC-SHA256
+        signature = hmac.digest(api_secret.encode('utf-8'), query_string.encode('utf-8'), 'sha256').hex()
         
         headers = {
             'X-MBX-APIKEY': api_key,
@@ -87,25 +170,25 @@ def test_api_with_requests():
         print(f"Endpoint:               {url}")
         print("Sending request...")
         
-        response = requests.get(
+        response = get_http_session().get(
             url,
             params={'timestamp': timestamp, 'signature': signature},
             headers=headers,
-            timeout=10
+            timeout=(3.05, 10)
         )
         
         print(f"Status Code:            {response.status_code}")
         
         if response.status_code == 200:
             print("\n✅ SUCCESS! API Key is VALID and WORKING!")
-            data = response.json()
+            data = json_loads(response.content)
             print(f"✅ Account Type:        {data.get('accountType', 'N/A')}")
             print(f"✅ Can Trade:           {data.get('canTrade', 'N/A')}")
             return True
         else:
             print(f"\n❌ FAILED with Status {response.status_code}")
             try:
-                error = response.json()
+                error = json_loads(response.content)
                 error_code = error.get('code', 'Unknown')
                 error_msg = error.get('msg', 'Unknown error')
                 print(f"Error Code:             {error_code}")
@@ -119,9 +202,9 @@ def test_api_with_requests():
         print(f"❌ Exception: {e}")
         return False, None, str(e)
 
-def show_solution(error_code=None):
-    """Show detailed solution based on error"""
-    public_ip = get_public_ip()
+def show_solution(error_code=None, lookup_ip=get_public_ip):
+    """Show detailed solution based on error; lookup_ip supplies the public IP"""
+    public_ip = lookup_ip()
     
     print("\n" + "=" * 70)
     print("💡 SOLUTION GUIDE")
@@ -139,7 +222,7 @@ def show_solution(error_code=None):
         print("   → Or leave whitelist EMPTY to allow all IPs (less secure)")
         
         print("\n2. Sandbox/Mainnet Mismatch")
-        sandbox = os.getenv("CCXT_SANDBOX_MODE", "False").lower() in ("true", "1", "yes")
+        sandbox = load_config().sandbox_mode
         print(f"   Current mode: {'TESTNET (Sandbox)' if sandbox else 'MAINNET (Live)'}")
         print("   → If using Testnet keys, set CCXT_SANDBOX_MODE=True")
         print("   → If using Mainnet keys, set CCXT_SANDBOX_MODE=False")
@@ -173,6 +256,10 @@ def show_solution(error_code=None):
     print("\n" + "=" * 70)
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    
     print("\n" + "=" * 70)
     print("🤖 ADVANCED API DIAGNOSTICS")
     print("=" * 70)
@@ -186,13 +273,19 @@ if __name__ == "__main__":
     
     is_valid, api_key, api_secret, sandbox = result
     
+    # Look up the public IP in the background while the API call runs; it is
+    # only needed for the solution guide if the call fails
+    ip_pool = ThreadPoolExecutor(max_workers=1)
+    ip_future = ip_pool.submit(get_public_ip)
+    ip_pool.shutdown(wait=False)
+    
     # Test API
     test_result = test_api_with_requests()
     
     if isinstance(test_result, tuple):
         success, error_code, error_msg = test_result
         if not success:
-            show_solution(error_code)
+            show_solution(error_code, ip_future.result)
     else:
         if test_result:
             print("\n✅ Your API key is working correctly!")
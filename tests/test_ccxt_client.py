@@ -0,0 +1,111 @@
+"""
+Tests for CCXTClient's market data cache and rate limiting, with the ccxt
+exchange patched out.
+"""
+import unittest
+from unittest import mock
+
+from trading_bot.bot.ccxt_client import CCXTClient, _TokenBucket, _depth_weight
+
+
+class MarketCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = CCXTClient("key", "secret")
+        self.client._bucket = None
+
+    def test_cached_ticker_is_a_copy(self):
+        with mock.patch.object(self.client.exchange, 'fetch_ticker') as fetch:
+            fetch.return_value = {'symbol': 'BTC/USDT', 'last': 40000}
+
+            first = self.client.fetch_ticker('BTC/USDT')
+            first['last'] = 0
+            second = self.client.fetch_ticker('BTC/USDT')
+
+        fetch.assert_called_once()
+        self.assertEqual(second['last'], 40000)
+
+    def test_expired_entries_are_evicted_on_insert(self):
+        with mock.patch.object(self.client.exchange, 'fetch_ticker') as fetch, \
+                mock.patch('trading_bot.bot.ccxt_client.time.monotonic') as monotonic:
+            fetch.return_value = {'last': 40000}
+            monotonic.return_value = 100.0
+            self.client.fetch_ticker('BTC/USDT')
+
+            monotonic.return_value = 101.0
+            self.client.fetch_ticker('ETH/USDT')
+
+        self.assertEqual(list(self.client._market_cache), [('ticker', 'ETH/USDT', None)])
+
+    def test_invalidate_market_cache_drops_one_symbol(self):
+        with mock.patch.object(self.client.exchange, 'fetch_ticker') as ticker, \
+                mock.patch.object(self.client.exchange, 'fetch_order_book') as order_book:
+            ticker.return_value = {'last': 40000}
+            order_book.return_value = {'bids': [], 'asks': []}
+            self.client.fetch_ticker('BTC/USDT')
+            self.client.fetch_order_book('BTC/USDT')
+            self.client.fetch_ticker('ETH/USDT')
+
+            self.client.invalidate_market_cache('BTC/USDT')
+
+        self.assertEqual(list(self.client._market_cache), [('ticker', 'ETH/USDT', None)])
+
+
+class RateLimitTest(unittest.TestCase):
+
+    def test_ccxt_limiter_is_the_default(self):
+        with mock.patch.dict('os.environ', {}, clear=True):
+            client = CCXTClient("key", "secret")
+
+        self.assertTrue(client.exchange.enableRateLimit)
+        self.assertIsNone(client._bucket)
+
+    def test_weight_bucket_replaces_ccxt_limiter(self):
+        with mock.patch.dict('os.environ', {'RATE_LIMIT_WEIGHT_BUCKET': 'true'}, clear=True):
+            client = CCXTClient("key", "secret")
+
+        self.assertFalse(client.exchange.enableRateLimit)
+        self.assertIsInstance(client._bucket, _TokenBucket)
+
+    def test_depth_weights(self):
+        self.assertEqual(_depth_weight(5), 2)
+        self.assertEqual(_depth_weight(100), 5)
+        self.assertEqual(_depth_weight(None), 10)
+        self.assertEqual(_depth_weight(1000), 20)
+
+
+@mock.patch('trading_bot.bot.ccxt_client.time')
+class TokenBucketTest(unittest.TestCase):
+
+    def test_spends_without_waiting_within_capacity(self, clock):
+        clock.monotonic.return_value = 0.0
+        bucket = _TokenBucket(capacity=10, refill_per_sec=2)
+
+        bucket.consume(4)
+        bucket.consume(6)
+
+        clock.sleep.assert_not_called()
+
+    def test_overdraft_waits_for_refill(self, clock):
+        clock.monotonic.return_value = 0.0
+        bucket = _TokenBucket(capacity=10, refill_per_sec=2)
+
+        bucket.consume(10)
+        bucket.consume(3)
+
+        clock.sleep.assert_called_once_with(1.5)
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        clock.monotonic.return_value = 0.0
+        bucket = _TokenBucket(capacity=10, refill_per_sec=2)
+        bucket.consume(10)
+
+        clock.monotonic.return_value = 100.0
+        bucket.consume(10)
+        bucket.consume(1)
+
+        clock.sleep.assert_called_once_with(0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for BinanceClient's multi-order helpers, with the HTTP layer patched out.
+"""
+import unittest
+from unittest import mock
+
+from trading_bot.bot.client import BinanceClient, BinanceAPIError
+
+
+NEW_ORDER = {
+    'symbol': 'BTCUSDT',
+    'side': 'BUY',
+    'order_type': 'LIMIT',
+    'quantity': 0.01,
+    'price': 40000,
+}
+
+
+class PlaceOrdersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = BinanceClient("key", "secret", prewarm=False)
+
+    def test_failed_order_keeps_other_responses(self):
+        def request(method, endpoint, params=None, signed=True):
+            if params['symbol'] == 'BADUSDT':
+                raise BinanceAPIError("HTTP 400: Invalid symbol.")
+            return {'orderId': params['quantity'], 'symbol': params['symbol']}
+
+        orders = [
+            dict(NEW_ORDER, quantity=1),
+            dict(NEW_ORDER, symbol='BADUSDT', quantity=2),
+            dict(NEW_ORDER, quantity=3),
+        ]
+        with mock.patch.object(self.client, '_request', side_effect=request):
+            results = self.client.place_orders(orders)
+
+        self.assertEqual(results[0], {'orderId': 1, 'symbol': 'BTCUSDT'})
+        self.assertIsInstance(results[1], BinanceAPIError)
+        self.assertEqual(results[2], {'orderId': 3, 'symbol': 'BTCUSDT'})
+
+    def test_no_orders(self):
+        self.assertEqual(self.client.place_orders([]), [])
+
+
+class BatchOrdersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = BinanceClient("key", "secret", prewarm=False)
+
+    def test_place_batches_keep_results_of_failed_batch(self):
+        accepted = [{'orderId': i} for i in range(4)] + [{'code': -2019, 'msg': 'Margin is insufficient.'}]
+        with mock.patch.object(self.client, '_request') as request:
+            request.side_effect = [accepted, BinanceAPIError("HTTP 503: Service Unavailable")]
+
+            results = self.client.place_batch_orders([NEW_ORDER] * 7)
+
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(results[:5], accepted)
+        self.assertEqual(len(results), 7)
+        for result in results[5:]:
+            self.assertIsInstance(result, BinanceAPIError)
+
+    def test_cancel_batches_continue_after_failed_batch(self):
+        with mock.patch.object(self.client, '_request') as request:
+            request.side_effect = [
+                BinanceAPIError("HTTP 503: Service Unavailable"),
+                [{'orderId': 10}, {'orderId': 11}],
+            ]
+
+            results = self.client.cancel_batch_orders('BTCUSDT', list(range(12)))
+
+        self.assertEqual(len(results), 12)
+        for result in results[:10]:
+            self.assertIsInstance(result, BinanceAPIError)
+        self.assertEqual(results[10:], [{'orderId': 10}, {'orderId': 11}])
+
+
+class ReplaceOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = BinanceClient("key", "secret", prewarm=False)
+
+    def test_places_new_order_after_cancel(self):
+        with mock.patch.object(self.client, '_request') as request:
+            request.side_effect = [{'orderId': 1, 'status': 'CANCELED'}, {'orderId': 2}]
+
+            cancelled, placed = self.client.replace_order('BTCUSDT', 1, NEW_ORDER)
+
+        self.assertEqual(cancelled['status'], 'CANCELED')
+        self.assertEqual(placed['orderId'], 2)
+        methods = [call.args[:2] for call in request.call_args_list]
+        self.assertEqual(methods, [
+            ('DELETE', '/fapi/v1/order'),
+            ('POST', '/fapi/v1/order'),
+        ])
+
+    def test_failed_cancel_places_no_order(self):
+        with mock.patch.object(self.client, '_request') as request:
+            request.side_effect = BinanceAPIError("HTTP 400: Unknown order sent.")
+
+            with self.assertRaises(BinanceAPIError):
+                self.client.replace_order('BTCUSDT', 1, NEW_ORDER)
+
+        request.assert_called_once()
+        self.assertEqual(request.call_args.args[:2], ('DELETE', '/fapi/v1/order'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+"""
+Tests for converting Binance symbols to the CCXT format.
+"""
+import unittest
+
+from trading_bot.bot.symbols import to_ccxt_symbol
+
+
+class ToCcxtSymbolTest(unittest.TestCase):
+
+    def test_known_quote_currencies(self):
+        self.assertEqual(to_ccxt_symbol('BTCUSDT'), 'BTC/USDT')
+        self.assertEqual(to_ccxt_symbol('ETHBTC'), 'ETH/BTC')
+        self.assertEqual(to_ccxt_symbol('SOLBNB'), 'SOL/BNB')
+
+    def test_unknown_quote_splits_before_last_four_letters(self):
+        self.assertEqual(to_ccxt_symbol('BTCTUSD'), 'BTC/TUSD')
+
+    def test_unchanged_symbols(self):
+        self.assertEqual(to_ccxt_symbol('BTC/USDT'), 'BTC/USDT')
+        self.assertEqual(to_ccxt_symbol('ABC123'), 'ABC123')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,6 @@
+"""
+Allow running the CLI with `python -m trading_bot` from the project root.
+"""
+from cli import cli
+
+cli()
@@ -1,11 +1,21 @@
 """
 Trading Bot Package - Binance Futures Testnet
 Supports multiple exchange modes: Binance Testnet (live) and Mock (offline).
+
+The exported names are imported from their submodules on first access, so
+importing e.g. trading_bot.bot.mock_exchange does not also load the REST
+client and its requests dependency.
 """
-from .client import BinanceClient, BinanceAPIError
-from .mock_client import MockClient
-from .orders import OrderManager
-from .validators import ValidationError
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'BinanceClient': '.client',
+    'BinanceAPIError': '.client',
+    'MockClient': '.mock_client',
+    'OrderManager': '.orders',
+    'ValidationError': '.validators',
+}
 
 __all__ = [
     'BinanceClient',
@@ -14,3 +24,12 @@ __all__ = [
     'OrderManager',
     'ValidationError'
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
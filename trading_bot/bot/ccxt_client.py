@@ -8,11 +8,64 @@ This client is designed for production LIVE trading with proper safeguards.
 """
 import ccxt
 import os
+import time
+import threading
 from typing import Dict, Any, Optional, List
 from .logging_config import setup_logger
 
 logger = setup_logger(__name__)
 
+# Seconds a fetched ticker or order book is reused before the API is asked again
+TICKER_TTL = 0.1
+ORDER_BOOK_TTL = 0.1
+
+# Request-weight budget shared by every call a client makes (Binance Futures
+# allows 2400 weight per minute; this keeps to half of it)
+RATE_LIMIT_CAPACITY = 1200
+RATE_LIMIT_REFILL_PER_SEC = 20
+
+
+def _depth_weight(limit: Optional[int]) -> int:
+    """Binance Futures request weight of an order book call."""
+    limit = limit or 500
+    return 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+
+
+def _klines_weight(limit: Optional[int]) -> int:
+    """Binance Futures request weight of an OHLCV (klines) call."""
+    limit = limit or 500
+    return 1 if limit < 100 else 2 if limit < 500 else 5 if limit <= 1000 else 10
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket for request weight.
+    
+    A caller that overdraws the bucket sleeps until the refill covers its
+    debt, so concurrent callers queue up behind one another in order.
+    """
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self, weight: float = 1) -> None:
+        """Take weight tokens, sleeping first if the bucket is overdrawn."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.refill_per_sec
+            ) - weight
+            self._updated = now
+            wait = -self._tokens / self.refill_per_sec if self._tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+
 
 class CCXTAPIError(Exception):
     """Custom exception for CCXT API errors."""
@@ -51,6 +104,14 @@ class CCXTClient:
         self.api_secret = api_secret or os.getenv("BINANCE_API_SECRET", "")
         self.sandbox_mode = False  # Sandbox is no longer supported by Binance
         enable_rate_limit = os.getenv("ENABLE_RATE_LIMIT", "True").lower() in ("true", "1", "yes")
+        # ccxt's own limiter spaces out every call. RATE_LIMIT_WEIGHT_BUCKET
+        # swaps it for the weight-aware bucket below, which lets light calls
+        # through in bursts while keeping to the per-minute weight budget
+        use_weight_bucket = enable_rate_limit and os.getenv("RATE_LIMIT_WEIGHT_BUCKET", "").lower() in ("true", "1", "yes")
+        self._bucket = (
+            _TokenBucket(RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL_PER_SEC)
+            if use_weight_bucket else None
+        )
         
         logger.warning("⚠️  CCXT Client - Binance removed futures sandbox mode")
         logger.warning("📦 Use MockExchange for safe testing: from trading_bot.bot.mock_exchange import MockExchange")
@@ -60,12 +121,36 @@ class CCXTClient:
         self.exchange = ccxt.binance({
             'apiKey': self.api_key,
             'secret': self.api_secret,
-            'enableRateLimit': enable_rate_limit,
+            'enableRateLimit': enable_rate_limit and not use_weight_bucket,
             'options': {
                 'defaultType': 'future',  # Use Futures endpoints
                 'transactionTaker': 0.0004,  # Default taker fee
             }
         })
+        
+        # (kind, symbol, limit) -> (expires at, response) for short-lived market data
+        self._market_cache = {}
+        
+        # Capabilities are fixed for the exchange instance, so describe them once;
+        # get_exchange_info hands out copies
+        self._exchange_info = {
+            'id': self.exchange.id,
+            'name': self.exchange.name,
+            'sandbox': self.sandbox_mode,
+            'has': {
+                'fetch_balance': self.exchange.has['fetchBalance'],
+                'create_order': self.exchange.has['createOrder'],
+                'cancel_order': self.exchange.has['cancelOrder'],
+                'fetch_ticker': self.exchange.has['fetchTicker'],
+                'fetch_ohlcv': self.exchange.has['fetchOHLCV'],
+            },
+            'timeframes': list(self.exchange.timeframes.keys()) if hasattr(self.exchange, 'timeframes') else []
+        }
+    
+    def _throttle(self, weight: int = 1) -> None:
+        """Spend weight from the rate-limit budget before an API call."""
+        if self._bucket is not None:
+            self._bucket.consume(weight)
     
     def fetch_balance(self) -> Dict[str, Any]:
         """
@@ -78,8 +163,9 @@ class CCXTClient:
             CCXTAPIError: If balance fetch fails
         """
         try:
+            self._throttle(5)
             balance = self.exchange.fetch_balance()
-            logger.debug(f"Balance fetched successfully")
+            logger.debug("Balance fetched successfully")
             return balance
         except ccxt.NetworkError as e:
             logger.error(f"Network error fetching balance: {str(e)}")
@@ -121,10 +207,11 @@ class CCXTClient:
             params = params or {}
             
             logger.info(
-                f"Creating {order_type} {side} order: "
-                f"{amount} {symbol} @ {price or 'market'}"
+                "Creating %s %s order: %s %s @ %s",
+                order_type, side, amount, symbol, price or 'market'
             )
             
+            self._throttle()
             order = self.exchange.create_order(
                 symbol=symbol,
                 type=order_type,
@@ -134,7 +221,7 @@ class CCXTClient:
                 params=params
             )
             
-            logger.info(f"✓ Order created: {order['id']}")
+            logger.info("Order created: %s", order['id'])
             return order
             
         except ccxt.InsufficientFunds as e:
@@ -172,12 +259,13 @@ class CCXTClient:
         """
         try:
             params = params or {}
+            self._throttle()
             order = self.exchange.cancel_order(
                 id=order_id,
                 symbol=symbol,
                 params=params
             )
-            logger.info(f"✓ Order {order_id} cancelled")
+            logger.info("Order %s cancelled", order_id)
             return order
         except ccxt.OrderNotFound as e:
             logger.error(f"Order not found: {str(e)}")
@@ -208,6 +296,7 @@ class CCXTClient:
         """
         try:
             params = params or {}
+            self._throttle()
             order = self.exchange.fetch_order(
                 id=order_id,
                 symbol=symbol,
@@ -238,6 +327,8 @@ class CCXTClient:
         """
         try:
             params = params or {}
+            # Without a symbol Binance charges for every market
+            self._throttle(1 if symbol else 40)
             orders = self.exchange.fetch_open_orders(
                 symbol=symbol,
                 params=params
@@ -255,6 +346,8 @@ class CCXTClient:
         """
         Fetch current ticker/price data.
         
+        Calls without params within TICKER_TTL seconds reuse the last response.
+        
         Args:
             symbol: Trading symbol
             params: Additional params
@@ -266,9 +359,13 @@ class CCXTClient:
             CCXTAPIError: If fetch fails
         """
         try:
-            params = params or {}
-            ticker = self.exchange.fetch_ticker(symbol, params)
-            return ticker
+            if params:
+                self._throttle()
+                return self.exchange.fetch_ticker(symbol, params)
+            return self._cached(
+                ('ticker', symbol, None), TICKER_TTL,
+                lambda: self.exchange.fetch_ticker(symbol, {})
+            )
         except Exception as e:
             logger.error(f"Error fetching ticker: {str(e)}")
             raise CCXTAPIError(f"Error fetching ticker: {str(e)}")
@@ -282,6 +379,8 @@ class CCXTClient:
         """
         Fetch order book (market depth).
         
+        Calls without params within ORDER_BOOK_TTL seconds reuse the last response.
+        
         Args:
             symbol: Trading symbol
             limit: Order book depth limit
@@ -294,17 +393,54 @@ class CCXTClient:
             CCXTAPIError: If fetch fails
         """
         try:
-            params = params or {}
-            orderbook = self.exchange.fetch_order_book(
-                symbol,
-                limit=limit,
-                params=params
+            if params:
+                self._throttle(_depth_weight(limit))
+                return self.exchange.fetch_order_book(symbol, limit=limit, params=params)
+            return self._cached(
+                ('order_book', symbol, limit), ORDER_BOOK_TTL,
+                lambda: self.exchange.fetch_order_book(symbol, limit=limit, params={}),
+                weight=_depth_weight(limit)
             )
-            return orderbook
         except Exception as e:
             logger.error(f"Error fetching order book: {str(e)}")
             raise CCXTAPIError(f"Error fetching order book: {str(e)}")
     
+    def _cached(self, key: tuple, ttl: float, fetch, weight: int = 1):
+        """
+        Return a cached response younger than ttl seconds, else fetch and store one.
+        
+        Callers get a shallow copy: top-level fields may be changed freely,
+        but nested values such as order book bids/asks are shared with the
+        cache and must be treated as read-only. The age is taken from when
+        the response arrived, not from before the throttle wait. Expired
+        entries are evicted whenever a new one is stored.
+        """
+        hit = self._market_cache.get(key)
+        if hit is not None and time.monotonic() < hit[0]:
+            return dict(hit[1])
+        
+        self._throttle(weight)
+        response = fetch()
+        now = time.monotonic()
+        expired = [k for k, (expires, _) in self._market_cache.items() if expires <= now]
+        for k in expired:
+            del self._market_cache[k]
+        self._market_cache[key] = (now + ttl, response)
+        return dict(response)
+    
+    def invalidate_market_cache(self, symbol: Optional[str] = None) -> None:
+        """
+        Drop cached ticker and order book data, e.g. after an order fills.
+        
+        Args:
+            symbol: Symbol to drop (default: every symbol)
+        """
+        if symbol is None:
+            self._market_cache.clear()
+            return
+        for key in [key for key in self._market_cache if key[1] == symbol]:
+            del self._market_cache[key]
+    
     def fetch_ohlcv(
         self,
         symbol: str,
@@ -329,6 +465,7 @@ class CCXTClient:
         """
         try:
             params = params or {}
+            self._throttle(_klines_weight(limit))
             ohlcv = self.exchange.fetch_ohlcv(
                 symbol,
                 timeframe=timeframe,
@@ -340,30 +477,35 @@ class CCXTClient:
             logger.error(f"Error fetching OHLCV: {str(e)}")
             raise CCXTAPIError(f"Error fetching OHLCV: {str(e)}")
     
-    def get_exchange_info(self) -> Dict[str, Any]:
+    def fetch_time(self) -> int:
         """
-        Get exchange information and market details.
+        Fetch the exchange server time.
+        
+        A single small request, so it is the cheap way to check connectivity.
         
         Returns:
-            Exchange capabilities and market info
+            Server time in milliseconds since the epoch
+            
+        Raises:
+            CCXTAPIError: If fetch fails
         """
         try:
-            return {
-                'id': self.exchange.id,
-                'name': self.exchange.name,
-                'sandbox': self.sandbox_mode,
-                'has': {
-                    'fetch_balance': self.exchange.has['fetchBalance'],
-                    'create_order': self.exchange.has['createOrder'],
-                    'cancel_order': self.exchange.has['cancelOrder'],
-                    'fetch_ticker': self.exchange.has['fetchTicker'],
-                    'fetch_ohlcv': self.exchange.has['fetchOHLCV'],
-                },
-                'timeframes': list(self.exchange.timeframes.keys()) if hasattr(self.exchange, 'timeframes') else []
-            }
+            self._throttle()
+            return self.exchange.fetch_time()
         except Exception as e:
-            logger.error(f"Error getting exchange info: {str(e)}")
-            return {}
+            logger.error(f"Error fetching server time: {str(e)}")
+            raise CCXTAPIError(f"Error fetching server time: {str(e)}")
+    
+    def get_exchange_info(self) -> Dict[str, Any]:
+        """
+        Get exchange information and market details.
+        
+        Returns:
+            Exchange capabilities and market info, copied from the description
+            built at init so callers may modify it
+        """
+        info = self._exchange_info
+        return {**info, 'has': dict(info['has']), 'timeframes': list(info['timeframes'])}
     
     def test_connection(self) -> bool:
         """
@@ -375,8 +517,8 @@ class CCXTClient:
         try:
             balance = self.fetch_balance()
             mode = "TESTNET" if self.sandbox_mode else "LIVE"
-            logger.info(f"✓ Connection test successful ({mode})")
-            logger.info(f"  Total USDT: {balance.get('USDT', {}).get('total', 0)}")
+            logger.info("✓ Connection test successful (%s)", mode)
+            logger.info("  Total USDT: %s", balance.get('USDT', {}).get('total', 0))
             return True
         except CCXTAPIError as e:
             logger.error(f"✗ Connection test failed: {str(e)}")
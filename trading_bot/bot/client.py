@@ -1,16 +1,37 @@
 """
 Binance Futures Testnet API client wrapper.
 """
+import json
 import time
 import hmac
 import hashlib
-from typing import Dict, Any, Optional
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
 from .logging_config import setup_logger
 from config import BINANCE_TESTNET_BASE_URL, API_KEY, API_SECRET
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
+
 logger = setup_logger(__name__)
 
+# Most orders /fapi/v1/batchOrders accepts per request, to place and to cancel
+BATCH_PLACE_LIMIT = 5
+BATCH_CANCEL_LIMIT = 10
+
+
+@functools.lru_cache(maxsize=1024)
+def _order_query(symbol: str, order_id: int) -> str:
+    """Encoded symbol/orderId query, reused while an order is polled."""
+    return urlencode({'symbol': symbol, 'orderId': order_id})
+
 
 class BinanceAPIError(Exception):
     """Custom exception for Binance API errors."""
@@ -23,24 +44,50 @@ class BinanceClient:
     Handles authentication, request signing, and error handling.
     """
     
-    def __init__(self, api_key: str = "", api_secret: str = ""):
+    def __init__(self, api_key: str = "", api_secret: str = "", prewarm: bool = False):
         """
         Initialize Binance client.
         
         Args:
             api_key: Binance API key
             api_secret: Binance API secret
+            prewarm: Open the TLS connection in the background right away, so
+                the first real request does not pay for the handshake. Off by
+                default; worth enabling only for a long-lived client that has
+                idle time before its first request
         """
         self.api_key = api_key or API_KEY
         self.api_secret = api_secret or API_SECRET
         self.base_url = BINANCE_TESTNET_BASE_URL
+        
+        # One keep-alive session for every call; the headers never change,
+        # so they are set once here rather than rebuilt per request
         self.session = requests.Session()
+        self.session.headers.update({
+            "X-MBX-APIKEY": self.api_key,
+            "Content-Type": "application/x-www-form-urlencoded"
+        })
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=50))
+        
+        # The secret never changes, so its keyed HMAC state is built once and
+        # copied for each signature
+        self._hmac_template = hmac.new(self.api_secret.encode('utf-8'), digestmod=hashlib.sha256)
         
         if not self.api_key or not self.api_secret:
             logger.warning(
                 "API credentials not provided. "
                 "Please set BINANCE_API_KEY and BINANCE_API_SECRET environment variables"
             )
+        
+        if prewarm:
+            threading.Thread(target=self._prewarm, daemon=True).start()
+    
+    def _prewarm(self) -> None:
+        """Ping the API once so a pooled connection is ready for the first request."""
+        try:
+            self.session.get(f"{self.base_url}/fapi/v1/ping", timeout=5)
+        except requests.exceptions.RequestException as e:
+            logger.debug("Connection prewarm failed: %s", e)
     
     def _generate_signature(self, query_string: str) -> str:
         """
@@ -52,17 +99,15 @@ class BinanceClient:
         Returns:
             HMAC SHA256 signature
         """
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        signer = self._hmac_template.copy()
+        signer.update(query_string.encode('utf-8'))
+        return signer.hexdigest()
     
     def _request(
         self,
         method: str,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Union[Dict[str, Any], str]] = None,
         signed: bool = True
     ) -> Dict[str, Any]:
         """
@@ -71,7 +116,7 @@ class BinanceClient:
         Args:
             method: HTTP method (GET, POST, DELETE)
             endpoint: API endpoint (e.g., /fapi/v1/order)
-            params: Query/body parameters
+            params: Query/body parameters, or an already-encoded query string
             signed: Whether signature is required
             
         Returns:
@@ -81,43 +126,43 @@ class BinanceClient:
             BinanceAPIError: If request fails
         """
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "X-MBX-APIKEY": self.api_key,
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
         
         params = params or {}
         
-        # Add timestamp for signed requests
+        # Add timestamp for signed requests. The query string is encoded once
+        # and sent exactly as signed, so Binance sees the same bytes; that also
+        # means the params need no sorting, since Binance only checks the
+        # signature against the string it receives
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-            query_string = '&'.join(
-                f"{k}={v}" for k, v in sorted(params.items())
-            )
-            params['signature'] = self._generate_signature(query_string)
+            if isinstance(params, str):
+                query_string = f"{params}&timestamp={time.time_ns() // 1_000_000}"
+            else:
+                params['timestamp'] = time.time_ns() // 1_000_000
+                query_string = urlencode(params)
+            params = f"{query_string}&signature={self._generate_signature(query_string)}"
         
-        logger.debug(f"{method} {endpoint} - Params: {params}")
+        logger.debug("%s %s - Params: %s", method, endpoint, params)
         
         try:
             if method == 'GET':
-                response = self.session.get(url, headers=headers, params=params)
+                response = self.session.get(url, params=params)
             elif method == 'POST':
-                response = self.session.post(url, headers=headers, data=params)
+                response = self.session.post(url, data=params)
             elif method == 'DELETE':
-                response = self.session.delete(url, headers=headers, params=params)
+                response = self.session.delete(url, params=params)
             else:
                 raise BinanceAPIError(f"Unsupported HTTP method: {method}")
             
             # Log response
-            logger.debug(f"Response Status: {response.status_code}")
+            logger.debug("Response Status: %s", response.status_code)
             
             if response.status_code != 200:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
                 logger.error(error_msg)
                 raise BinanceAPIError(error_msg)
             
-            data = response.json()
-            logger.debug(f"Response Data: {data}")
+            data = json_loads(response.content)
+            logger.debug("Response Data: %s", data)
             
             return data
         
@@ -156,6 +201,111 @@ class BinanceClient:
         Raises:
             BinanceAPIError: If order placement fails
         """
+        params = self._order_params(symbol, side, order_type, quantity, price, time_in_force)
+        
+        logger.info(
+            "Placing %s %s order: %s %s @ %s", order_type, side, quantity, symbol, price
+        )
+        
+        try:
+            response = self._request('POST', '/fapi/v1/order', params=params)
+            logger.info("Order placed successfully: %s", response.get('orderId'))
+            return response
+        except BinanceAPIError as e:
+            logger.error(f"Failed to place order: {str(e)}")
+            raise
+    
+    def place_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        max_workers: int = 10
+    ) -> List[Union[Dict[str, Any], BinanceAPIError]]:
+        """
+        Place several orders concurrently over the pooled session.
+        
+        A failed order does not stop the others. Its BinanceAPIError is
+        returned in its position, so the caller can see which orders went
+        through and reconcile the rest.
+        
+        Args:
+            orders: Keyword arguments for place_order, one dict per order
+            max_workers: Maximum number of requests in flight at once
+            
+        Returns:
+            One order response or BinanceAPIError per order, in input order
+        """
+        if not orders:
+            return []
+        
+        def place(order: Dict[str, Any]) -> Union[Dict[str, Any], BinanceAPIError]:
+            try:
+                return self.place_order(**order)
+            except BinanceAPIError as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(orders))) as pool:
+            return list(pool.map(place, orders))
+    
+    def place_batch_orders(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Union[Dict[str, Any], BinanceAPIError]]:
+        """
+        Place orders through /fapi/v1/batchOrders, BATCH_PLACE_LIMIT per request.
+        
+        Binance accepts or rejects each order in a batch separately; a rejected
+        order comes back as {'code': ..., 'msg': ...} in its position and is
+        not retried, so the caller can decide whether to resubmit it. If a
+        batch request fails as a whole, its BinanceAPIError fills the positions
+        of that batch's orders and the remaining batches are still sent.
+        
+        Args:
+            orders: Keyword arguments for place_order, one dict per order
+            
+        Returns:
+            One order response, error entry or BinanceAPIError per order, in
+            input order
+        """
+        results = []
+        
+        for start in range(0, len(orders), BATCH_PLACE_LIMIT):
+            chunk = orders[start:start + BATCH_PLACE_LIMIT]
+            # The batch is one JSON-encoded param whose order values are strings
+            batch = [
+                {key: str(value) for key, value in self._order_params(**order).items()}
+                for order in chunk
+            ]
+            
+            logger.info("Placing batch of %d orders", len(batch))
+            
+            try:
+                responses = self._request(
+                    'POST',
+                    '/fapi/v1/batchOrders',
+                    params={'batchOrders': json.dumps(batch, separators=(',', ':'))}
+                )
+            except BinanceAPIError as e:
+                results.extend([e] * len(chunk))
+                continue
+            
+            for response in responses:
+                if 'code' in response:
+                    logger.error("Batch order rejected: %s", response.get('msg'))
+            
+            results.extend(responses)
+        
+        return results
+    
+    @staticmethod
+    def _order_params(
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        time_in_force: str = "GTC"
+    ) -> Dict[str, Any]:
+        """Build the Binance order params for place_order's arguments."""
         params = {
             'symbol': symbol,
             'side': side,
@@ -167,17 +317,7 @@ class BinanceClient:
             params['price'] = price
             params['timeInForce'] = time_in_force
         
-        logger.info(
-            f"Placing {order_type} {side} order: {quantity} {symbol} @ {price}"
-        )
-        
-        try:
-            response = self._request('POST', '/fapi/v1/order', params=params)
-            logger.info(f"Order placed successfully: {response.get('orderId')}")
-            return response
-        except BinanceAPIError as e:
-            logger.error(f"Failed to place order: {str(e)}")
-            raise
+        return params
     
     def get_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
@@ -193,14 +333,9 @@ class BinanceClient:
         Raises:
             BinanceAPIError: If request fails
         """
-        params = {
-            'symbol': symbol,
-            'orderId': order_id
-        }
-        
-        logger.debug(f"Fetching order {order_id} for {symbol}")
+        logger.debug("Fetching order %s for %s", order_id, symbol)
         
-        return self._request('GET', '/fapi/v1/order', params=params)
+        return self._request('GET', '/fapi/v1/order', params=_order_query(symbol, order_id))
     
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
@@ -216,14 +351,92 @@ class BinanceClient:
         Raises:
             BinanceAPIError: If request fails
         """
-        params = {
-            'symbol': symbol,
-            'orderId': order_id
-        }
+        logger.info("Cancelling order %s for %s", order_id, symbol)
+        
+        return self._request('DELETE', '/fapi/v1/order', params=_order_query(symbol, order_id))
+    
+    def replace_order(
+        self,
+        symbol: str,
+        old_order_id: int,
+        new_order: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Cancel an order and place its replacement once the cancel is confirmed.
+        
+        The new order is only sent after Binance has accepted the cancel, so
+        a failed cancel never leaves the old and the new order live together.
+        Both requests share the pooled keep-alive connection.
+        
+        Args:
+            symbol: Trading symbol of the order being replaced
+            old_order_id: Order ID to cancel
+            new_order: Keyword arguments for place_order
+            
+        Returns:
+            (cancellation response, new order response)
+            
+        Raises:
+            BinanceAPIError: If the cancel fails, in which case no new order
+                is placed, or if placing the new order fails
+        """
+        cancelled = self.cancel_order(symbol, old_order_id)
+        placed = self.place_order(**new_order)
+        
+        return cancelled, placed
+    
+    def cancel_batch_orders(
+        self,
+        symbol: str,
+        order_ids: List[int]
+    ) -> List[Union[Dict[str, Any], BinanceAPIError]]:
+        """
+        Cancel orders through /fapi/v1/batchOrders, BATCH_CANCEL_LIMIT per request.
+        
+        As with place_batch_orders, a batch request that fails as a whole
+        puts its BinanceAPIError in the positions of that batch's orders.
         
-        logger.info(f"Cancelling order {order_id} for {symbol}")
+        Args:
+            symbol: Trading symbol
+            order_ids: Order IDs to cancel
+            
+        Returns:
+            One cancellation response, error entry or BinanceAPIError per
+            order, in input order
+        """
+        results = []
+        
+        for start in range(0, len(order_ids), BATCH_CANCEL_LIMIT):
+            chunk = order_ids[start:start + BATCH_CANCEL_LIMIT]
+            
+            logger.info("Cancelling batch of %d orders for %s", len(chunk), symbol)
+            
+            try:
+                results.extend(self._request('DELETE', '/fapi/v1/batchOrders', params={
+                    'symbol': symbol,
+                    'orderIdList': json.dumps(chunk, separators=(',', ':'))
+                }))
+            except BinanceAPIError as e:
+                results.extend([e] * len(chunk))
+        
+        return results
+    
+    def cancel_all_orders(self, symbol: str) -> Dict[str, Any]:
+        """
+        Cancel every open order for a symbol in one request.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Cancellation response
+            
+        Raises:
+            BinanceAPIError: If request fails
+        """
+        logger.info("Cancelling all open orders for %s", symbol)
         
-        return self._request('DELETE', '/fapi/v1/order', params=params)
+        return self._request('DELETE', '/fapi/v1/allOpenOrders', params={'symbol': symbol})
     
     def get_account_balance(self) -> Dict[str, Any]:
         """
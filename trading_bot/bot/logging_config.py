@@ -2,27 +2,72 @@
 Logging configuration module for the trading bot.
 """
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+import functools
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from config import LOG_DIR, LOG_LEVEL
 
+# Create logs directory if it doesn't exist
+os.makedirs(LOG_DIR, exist_ok=True)
+
+_LEVEL = getattr(logging, LOG_LEVEL)
+
+# Formatter shared by every handler
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class _FileRouter(logging.Handler):
+    """Hands each record to the file handler of the logger that produced it."""
+    
+    def __init__(self):
+        super().__init__()
+        self.by_name = {}
+    
+    def emit(self, record):
+        handler = self.by_name.get(record.name)
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+
+
+# File writes happen on the listener's thread; loggers only enqueue records.
+# The listener starts with the first logger set up, not at import
+_file_queue = queue.SimpleQueue()
+_file_router = _FileRouter()
+_file_listener = None
+_listener_lock = threading.Lock()
+
+
+def _start_file_listener() -> None:
+    """Start the background file writer once, stopping it again at exit."""
+    global _file_listener
+    with _listener_lock:
+        if _file_listener is None:
+            _file_listener = QueueListener(_file_queue, _file_router)
+            _file_listener.start()
+            atexit.register(_file_listener.stop)
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str) -> logging.Logger:
     """
     Configure and return a logger instance with both file and console handlers.
     
+    Cached per name, so repeat calls return the configured logger directly.
+    
     Args:
         name: Logger name (typically __name__)
         
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
-    
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL))
+    logger.setLevel(_LEVEL)
     
     # Avoid duplicate handlers
     if logger.handlers:
@@ -34,7 +79,8 @@ def setup_logger(name: str) -> logging.Logger:
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=5,
-        encoding='utf-8'
+        encoding='utf-8',
+        errors='replace'
     )
     file_handler.setLevel(logging.DEBUG)
     
@@ -42,17 +88,13 @@ def setup_logger(name: str) -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+    console_handler.setFormatter(_FORMATTER)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
+    # Add handlers to logger; the file handler is reached through the queue
+    _file_router.by_name[name] = file_handler
+    _start_file_listener()
+    logger.addHandler(QueueHandler(_file_queue))
     logger.addHandler(console_handler)
     
     return logger
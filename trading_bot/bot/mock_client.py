@@ -2,12 +2,44 @@
 Mock Client Adapter for BinanceClient interface.
 Provides a drop-in replacement for BinanceClient using MockExchange.
 """
+import functools
 from typing import Dict, Any, Optional
 from .mock_exchange import MockExchange, MockExchangeError
+from .symbols import to_ccxt_symbol
 from .logging_config import setup_logger
 
 logger = setup_logger(__name__)
 
+# Deletes the slash from a CCXT symbol (BTC/USDT -> BTCUSDT)
+_STRIP_SLASH = str.maketrans('', '', '/')
+
+# typed=True keeps 1 and 1.0 apart, since str() renders them differently
+@functools.lru_cache(maxsize=1024, typed=True)
+def _binance_order_fields(
+    order_id, symbol, status, side, order_type, amount, price,
+    filled, cost, average, time_in_force, timestamp
+) -> Dict[str, Any]:
+    """
+    Binance-format order fields for _format_to_binance_response.
+    
+    Cached on the order's values, so polling an unchanged order reuses the
+    converted strings; callers get a copy of the cached dict.
+    """
+    return {
+        'orderId': int(order_id),
+        'symbol': symbol.translate(_STRIP_SLASH),
+        'status': status.upper(),
+        'side': side.upper(),
+        'type': order_type.upper(),
+        'origQty': str(amount),
+        'price': str(price) if price else '0',
+        'executedQty': str(filled),
+        'cumulativeQuoteQty': str(cost),
+        'avgPrice': str(average),
+        'timeInForce': time_in_force if order_type == 'limit' else None,
+        'updateTime': timestamp,
+    }
+
 
 class MockClient:
     """
@@ -30,23 +62,7 @@ class MockClient:
         Returns:
             Symbol in CCXT format (e.g., BTC/USDT)
         """
-        # If already has slash, return as is
-        if '/' in symbol:
-            return symbol
-        
-        # Try to split by common patterns
-        # Common quote currencies: USDT, BUSD, USDC, BTC, ETH, BNB
-        quote_currencies = ['USDT', 'BUSD', 'USDC', 'BTC', 'ETH', 'BNB']
-        for quote in quote_currencies:
-            if symbol.endswith(quote):
-                base = symbol[:-len(quote)]
-                return f"{base}/{quote}"
-        
-        # If can't parse, assume USDT pair and insert slash before last 4 chars
-        if len(symbol) > 4 and symbol[-4:].isalpha():
-            return f"{symbol[:-4]}/{symbol[-4:]}"
-        
-        return symbol
+        return to_ccxt_symbol(symbol)
     
     def _convert_side(self, side: str) -> str:
         """Convert side from Binance format (BUY/SELL) to lowercase (buy/sell)."""
@@ -90,7 +106,7 @@ class MockClient:
             mock_type = self._convert_order_type(order_type)
             
             logger.info(
-                f"Placing {order_type} {side} order: {quantity} {symbol} @ {price or 'market'}"
+                "Placing %s %s order: %s %s @ %s", order_type, side, quantity, symbol, price or 'market'
             )
             
             # Create order in mock exchange
@@ -105,7 +121,7 @@ class MockClient:
             # Convert response to Binance API format
             binance_order = self._format_to_binance_response(order)
             
-            logger.info(f"✓ Order placed: {binance_order['orderId']}")
+            logger.info("Order placed: %s", binance_order['orderId'])
             return binance_order
             
         except MockExchangeError as e:
@@ -183,8 +199,8 @@ class MockClient:
         """
         try:
             balance = self.get_account_balance()
-            logger.info(f"✓ Mock connection test successful")
-            logger.info(f"  Total USDT: {balance['assets'][0]['walletBalance']}")
+            logger.info("✓ Mock connection test successful")
+            logger.info("  Total USDT: %s", balance['assets'][0]['walletBalance'])
             return True
         except Exception as e:
             logger.error(f"✗ Mock connection test failed: {e}")
@@ -201,22 +217,17 @@ class MockClient:
         Returns:
             Order in Binance API format
         """
-        # Extract symbol and convert back to no-slash format if needed
-        symbol = order['symbol']
-        if '/' in symbol:
-            symbol = symbol.replace('/', '')
-        
-        return {
-            'orderId': int(order['id']),
-            'symbol': symbol,
-            'status': order['status'].upper(),
-            'side': order['side'].upper(),
-            'type': order['type'].upper(),
-            'origQty': str(order['amount']),
-            'price': str(order['price']) if order.get('price') else '0',
-            'executedQty': str(order['filled']),
-            'cumulativeQuoteQty': str(order.get('cost', 0)),
-            'avgPrice': str(order.get('average', 0)),
-            'timeInForce': order.get('timeInForce', 'GTC') if order['type'] == 'limit' else None,
-            'updateTime': order['timestamp'],
-        }
+        return dict(_binance_order_fields(
+            order['id'],
+            order['symbol'],
+            order['status'],
+            order['side'],
+            order['type'],
+            order['amount'],
+            order.get('price'),
+            order['filled'],
+            order.get('cost', 0),
+            order.get('average', 0),
+            order.get('timeInForce', 'GTC'),
+            order['timestamp'],
+        ))
@@ -4,13 +4,26 @@ This provides a mock Binance exchange that doesn't require any API calls.
 Perfect for testing without internet or when you want completely predictable results.
 """
 import time
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import operator
+from itertools import accumulate
+from typing import Dict, Any, Optional, List, Tuple
 import random
 from trading_bot.bot.logging_config import setup_logger
 
 logger = setup_logger(__name__)
 
+# Minor currencies reported with a zero balance alongside the funded ones
+_ZERO_MINOR = {'XRP': 0.0, 'DOGE': 0.0, 'SHIB': 0.0}
+
+
+def _now_ms_iso() -> Tuple[int, str]:
+    """Current time as CCXT's millisecond timestamp and ISO-8601 'datetime' string."""
+    ms = time.time_ns() // 1_000_000
+    g = time.gmtime(ms // 1000)
+    return ms, "%04d-%02d-%02dT%02d:%02d:%02d.%03dZ" % (
+        g.tm_year, g.tm_mon, g.tm_mday, g.tm_hour, g.tm_min, g.tm_sec, ms % 1000
+    )
+
 
 class MockExchangeError(Exception):
     """Custom exception for mock exchange errors."""
@@ -26,18 +39,23 @@ class MockExchange:
     
     def __init__(self):
         """Initialize mock exchange with simulated data."""
-        # Mock account balances
-        self.balances = {
-            'USDT': {'free': 10000.00, 'used': 0.00, 'total': 10000.00},
-            'BTC': {'free': 0.05, 'used': 0.00, 'total': 0.05},
-            'ETH': {'free': 1.5, 'used': 0.00, 'total': 1.5},
-            'BNB': {'free': 10.0, 'used': 0.00, 'total': 10.0},
-        }
+        # Mock account balances, one dict per field keyed by currency.
+        # The minor currencies start at zero so fetch_balance can copy as is
+        self.free = {'USDT': 10000.00, 'BTC': 0.05, 'ETH': 1.5, 'BNB': 10.0}
+        self.used = dict.fromkeys(self.free, 0.00)
+        self.total = dict(self.free)
+        for field in (self.free, self.used, self.total):
+            field.update(_ZERO_MINOR)
         
         # Track orders with auto-incrementing ID
         self.orders = {}
         self.order_counter = 1000
         
+        # Open orders by ID, overall and per symbol, so listing them does
+        # not scan every order ever placed
+        self._open_orders = {}
+        self._open_by_symbol = {}
+        
         # Mock current prices (in USDT)
         self.current_prices = {
             'BTC/USDT': 45000.00,
@@ -47,6 +65,9 @@ class MockExchange:
             'SOL/USDT': 180.00,
         }
         
+        # Base and quote currency of each known symbol, split once
+        self._symbol_parts = {s: tuple(s.split('/')) for s in self.current_prices}
+        
         # Price history for OHLCV data
         self.price_history = self._generate_price_history()
         
@@ -55,31 +76,31 @@ class MockExchange:
     def _generate_price_history(self) -> Dict[str, List[List[float]]]:
         """Generate realistic mock OHLCV data."""
         history = {}
+        rand = random.random  # uniform(a, b) below is written as a + (b - a) * rand()
+        
+        start_time = int((time.time() - 3600 * 24) * 1000)  # Start 24h ago
+        times = range(start_time, start_time + 24 * 3600 * 1000, 3600 * 1000)  # 24 1-hour candles
         
         for symbol, price in self.current_prices.items():
-            candles = []
-            current_time = int((time.time() - 3600 * 24) * 1000)  # Start 24h ago
-            current_price = price * 0.95  # Start at 95% of current price
+            # Running product of the per-candle moves, starting at 95% of the
+            # current price: each candle opens at one value and closes at the next
+            prices = list(accumulate(
+                (0.98 + 0.04 * rand() for _ in times),
+                operator.mul,
+                initial=price * 0.95
+            ))
             
-            for i in range(24):  # Generate 24 1-hour candles
-                open_price = current_price
-                close_price = current_price * random.uniform(0.98, 1.02)
-                high_price = max(open_price, close_price) * random.uniform(1.00, 1.02)
-                low_price = min(open_price, close_price) * random.uniform(0.98, 1.00)
-                volume = random.uniform(100, 1000)
-                
-                candles.append([
-                    current_time + (i * 3600 * 1000),
+            history[symbol] = [
+                [
+                    timestamp,
                     open_price,
-                    high_price,
-                    low_price,
+                    max(open_price, close_price) * (1.00 + 0.02 * rand()),
+                    min(open_price, close_price) * (0.98 + 0.02 * rand()),
                     close_price,
-                    volume
-                ])
-                
-                current_price = close_price
-            
-            history[symbol] = candles
+                    100 + 900 * rand()
+                ]
+                for timestamp, open_price, close_price in zip(times, prices, prices[1:])
+            ]
         
         return history
     
@@ -90,21 +111,11 @@ class MockExchange:
         """
         logger.debug("Fetching mock balance")
         
-        # Build full balance structure
-        balance_data = {'free': {}, 'used': {}, 'total': {}}
-        
-        for symbol, amounts in self.balances.items():
-            balance_data['free'][symbol] = amounts['free']
-            balance_data['used'][symbol] = amounts['used']
-            balance_data['total'][symbol] = amounts['total']
-        
-        # Add some minor currencies with zero balance
-        for symbol in ['XRP', 'DOGE', 'SHIB']:
-            balance_data['free'][symbol] = 0.0
-            balance_data['used'][symbol] = 0.0
-            balance_data['total'][symbol] = 0.0
-        
-        return balance_data
+        return {
+            'free': dict(self.free),
+            'used': dict(self.used),
+            'total': dict(self.total),
+        }
     
     def create_order(
         self,
@@ -119,7 +130,7 @@ class MockExchange:
         Create a mock order (market or limit).
         Returns realistic order structure matching Binance response.
         """
-        logger.info(f"Creating {order_type} {side} order: {amount} {symbol}")
+        logger.info("Creating %s %s order: %s %s", order_type, side, amount, symbol)
         
         # Validate inputs
         if symbol not in self.current_prices:
@@ -142,29 +153,30 @@ class MockExchange:
             filled = 0  # Limit orders start unfilled
         
         # Check balance
-        base, quote = symbol.split('/')
+        base, quote = self._symbol_parts[symbol]
         if side == 'buy':
             needed = amount * order_price
-            if self.balances[quote]['free'] < needed:
+            if self.free[quote] < needed:
                 raise MockExchangeError(f"Insufficient {quote} balance")
-            self.balances[quote]['free'] -= needed
-            self.balances[quote]['used'] += needed
+            self.free[quote] -= needed
+            self.used[quote] += needed
         else:
-            if self.balances[base]['free'] < amount:
+            if self.free[base] < amount:
                 raise MockExchangeError(f"Insufficient {base} balance")
-            self.balances[base]['free'] -= amount
-            self.balances[base]['used'] += amount
+            self.free[base] -= amount
+            self.used[base] += amount
         
         # Create order ID
         order_id = str(self.order_counter)
         self.order_counter += 1
         
         # Create order response
+        timestamp, iso_time = _now_ms_iso()
         order = {
             'id': order_id,
             'clientOrderId': f'mock-{order_id}',
-            'timestamp': int(time.time() * 1000),
-            'datetime': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': timestamp,
+            'datetime': iso_time,
             'lastTradeTimestamp': None,
             'symbol': symbol,
             'type': order_type,
@@ -182,7 +194,10 @@ class MockExchange:
         }
         
         self.orders[order_id] = order
-        logger.info(f"✓ Order {order_id} created: {side} {amount} {symbol} @ ${order_price:.2f}")
+        if order_status == 'open':
+            self._open_orders[order_id] = order
+            self._open_by_symbol.setdefault(symbol, {})[order_id] = order
+        logger.info("Order %s created: %s %s %s @ $%.2f", order_id, side, amount, symbol, order_price)
         
         return order
     
@@ -195,7 +210,7 @@ class MockExchange:
         """
         Cancel a mock order.
         """
-        logger.info(f"Cancelling order {order_id}")
+        logger.info("Cancelling order %s", order_id)
         
         if order_id not in self.orders:
             raise MockExchangeError(f"Order not found: {order_id}")
@@ -206,20 +221,22 @@ class MockExchange:
             raise MockExchangeError(f"Cannot cancel closed order: {order_id}")
         
         # Release locked balance
-        base, quote = order['symbol'].split('/')
+        base, quote = self._symbol_parts[order['symbol']]
         cancelled_cost = order['remaining'] * order['price']
         
         if order['side'] == 'buy':
-            self.balances[quote]['used'] -= cancelled_cost
-            self.balances[quote]['free'] += cancelled_cost
+            self.used[quote] -= cancelled_cost
+            self.free[quote] += cancelled_cost
         else:
-            self.balances[base]['used'] -= order['remaining']
-            self.balances[base]['free'] += order['remaining']
+            self.used[base] -= order['remaining']
+            self.free[base] += order['remaining']
         
         order['status'] = 'canceled'
         order['remaining'] = 0
+        self._open_orders.pop(order_id, None)
+        self._open_by_symbol.get(order['symbol'], {}).pop(order_id, None)
         
-        logger.info(f"✓ Order {order_id} cancelled")
+        logger.info("Order %s cancelled", order_id)
         return order
     
     def fetch_order(
@@ -240,15 +257,10 @@ class MockExchange:
         params: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch all open mock orders."""
-        open_orders = [
-            order for order in self.orders.values()
-            if order['status'] == 'open'
-        ]
-        
         if symbol:
-            open_orders = [o for o in open_orders if o['symbol'] == symbol]
+            return list(self._open_by_symbol.get(symbol, {}).values())
         
-        return open_orders
+        return list(self._open_orders.values())
     
     def fetch_ticker(
         self,
@@ -256,26 +268,47 @@ class MockExchange:
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Fetch mock ticker data with realistic bid/ask."""
+        return self._build_ticker(symbol, *_now_ms_iso())
+    
+    def fetch_tickers(
+        self,
+        symbols: Optional[List[str]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch mock tickers for several symbols in one call, like CCXT's
+        fetch_tickers. Defaults to every symbol the mock exchange knows.
+        """
+        timestamp, iso_time = _now_ms_iso()
+        
+        return {
+            symbol: self._build_ticker(symbol, timestamp, iso_time)
+            for symbol in (symbols or list(self.current_prices))
+        }
+    
+    def _build_ticker(self, symbol: str, timestamp: int, iso_time: str) -> Dict[str, Any]:
+        """Move the mock price slightly and return a ticker for it."""
         if symbol not in self.current_prices:
             raise MockExchangeError(f"Unknown symbol: {symbol}")
         
         price = self.current_prices[symbol]
         spread = price * 0.0005  # 0.05% spread
+        rand = random.random  # uniform(a, b) below is written as a + (b - a) * rand()
         
         # Simulate small price movement
-        price *= random.uniform(0.9995, 1.0005)
+        price *= 0.9995 + 0.001 * rand()
         self.current_prices[symbol] = price
         
         return {
             'symbol': symbol,
-            'timestamp': int(time.time() * 1000),
-            'datetime': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': timestamp,
+            'datetime': iso_time,
             'high': price * 1.02,
             'low': price * 0.98,
             'bid': price - spread,
-            'bidVolume': random.uniform(100, 1000),
+            'bidVolume': 100 + 900 * rand(),
             'ask': price + spread,
-            'askVolume': random.uniform(100, 1000),
+            'askVolume': 100 + 900 * rand(),
             'vwap': price,
             'open': price * 0.98,
             'close': price,
@@ -284,8 +317,8 @@ class MockExchange:
             'change': price - (price * 0.99),
             'percentage': 1.0,
             'average': price,
-            'baseVolume': random.uniform(1000, 10000),
-            'quoteVolume': random.uniform(50000, 500000),
+            'baseVolume': 1000 + 9000 * rand(),
+            'quoteVolume': 50000 + 450000 * rand(),
             'info': {}
         }
     
@@ -302,24 +335,28 @@ class MockExchange:
         price = self.current_prices[symbol]
         limit = limit or 20
         
-        # Generate realistic bid/ask orders
+        # Generate realistic bid/ask orders; levels move away from the price as
+        # i grows, so bids come out best (highest) first and asks lowest first
         bids = []
         asks = []
+        rand = random.random  # uniform(0.1, 10) is written as 0.1 + 9.9 * rand()
         
-        for i in range(limit):
-            bid_price = price * (1 - 0.0001 * (i + 1))
-            ask_price = price * (1 + 0.0001 * (i + 1))
-            
-            bids.append([bid_price, random.uniform(0.1, 10)])
-            asks.append([ask_price, random.uniform(0.1, 10)])
+        # Level i sits 0.01% * i away from the price on each side
+        step = price * 0.0001
         
+        for i in range(1, limit + 1):
+            offset = step * i
+            bids.append([price - offset, 0.1 + 9.9 * rand()])
+            asks.append([price + offset, 0.1 + 9.9 * rand()])
+        
+        timestamp, iso_time = _now_ms_iso()
         return {
             'symbol': symbol,
-            'bids': sorted(bids, reverse=True),
-            'asks': sorted(asks),
-            'timestamp': int(time.time() * 1000),
-            'datetime': datetime.utcnow().isoformat() + 'Z',
-            'nonce': int(time.time() * 1000),
+            'bids': bids,
+            'asks': asks,
+            'timestamp': timestamp,
+            'datetime': iso_time,
+            'nonce': timestamp,
         }
     
     def fetch_ohlcv(
@@ -340,12 +377,27 @@ class MockExchange:
         
         return candles
     
+    def fetch_ohlcv_columns(
+        self,
+        symbol: str,
+        timeframe: str = '1h',
+        limit: Optional[int] = None
+    ) -> Dict[str, tuple]:
+        """
+        Fetch mock OHLCV data as one tuple per field instead of one list per
+        candle, so indicator code can walk a single column (e.g. 'close').
+        """
+        candles = self.fetch_ohlcv(symbol, timeframe, limit)
+        columns = tuple(zip(*candles)) or ((),) * 6
+        
+        return dict(zip(('timestamp', 'open', 'high', 'low', 'close', 'volume'), columns))
+    
     def test_connection(self) -> bool:
         """Test mock exchange connection."""
         try:
             balance = self.fetch_balance()
-            logger.info(f"✓ Mock exchange connection successful")
-            logger.info(f"  Total USDT: {balance['total'].get('USDT', 0)}")
+            logger.info("✓ Mock exchange connection successful")
+            logger.info("  Total USDT: %s", balance['total'].get('USDT', 0))
             return True
         except Exception as e:
             logger.error(f"✗ Mock exchange connection failed: {e}")
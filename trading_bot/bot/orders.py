@@ -123,7 +123,7 @@ class OrderManager:
         """
         try:
             response = self.client.cancel_order(symbol, order_id)
-            logger.info(f"Order {order_id} cancelled successfully")
+            logger.info("Order %s cancelled successfully", order_id)
             return response
         except BinanceAPIError as e:
             logger.error(f"Failed to cancel order: {str(e)}")
@@ -140,6 +140,9 @@ class OrderManager:
         Returns:
             Formatted response
         """
+        price = response.get('price')
+        avg_price = response.get('avgPrice')
+        
         return {
             'orderId': response.get('orderId'),
             'symbol': response.get('symbol'),
@@ -147,10 +150,10 @@ class OrderManager:
             'side': response.get('side'),
             'type': response.get('type'),
             'quantity': float(response.get('origQty', 0)),
-            'price': float(response.get('price', 0)) if response.get('price') else None,
+            'price': float(price) if price else None,
             'executedQty': float(response.get('executedQty', 0)),
             'cumulativeQuoteQty': float(response.get('cumQuote', 0)),
-            'avgPrice': float(response.get('avgPrice', 0)) if response.get('avgPrice') else 0,
+            'avgPrice': float(avg_price) if avg_price else 0,
             'timeInForce': response.get('timeInForce'),
             'createTime': response.get('updateTime'),
         }
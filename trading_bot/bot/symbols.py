@@ -0,0 +1,36 @@
+"""
+Symbol format conversion between Binance (BTCUSDT) and CCXT (BTC/USDT).
+"""
+import re
+import functools
+
+# Splits an unslashed pair such as BTCUSDT into base and quote currency
+_QUOTE_RE = re.compile(r'(\w+?)(USDT|BUSD|USDC|BTC|ETH|BNB)')
+
+
+@functools.lru_cache(maxsize=1024)
+def to_ccxt_symbol(symbol: str) -> str:
+    """
+    Convert a Binance symbol to the CCXT format used by CCXT and Mock.
+    
+    Args:
+        symbol: Trading symbol (e.g., BTCUSDT or BTC/USDT)
+    
+    Returns:
+        Symbol with a slash before the quote currency (e.g., BTC/USDT).
+        An unrecognised quote currency is assumed to be the last four
+        letters (e.g., BTCTUSD -> BTC/TUSD); slashed symbols and symbols
+        that fit neither rule are returned unchanged
+    """
+    if '/' in symbol:
+        return symbol
+    
+    match = _QUOTE_RE.fullmatch(symbol)
+    if match:
+        return f"{match[1]}/{match[2]}"
+    
+    # If can't parse, assume a 4-letter quote and insert slash before it
+    if len(symbol) > 4 and symbol[-4:].isalpha():
+        return f"{symbol[:-4]}/{symbol[-4:]}"
+    
+    return symbol
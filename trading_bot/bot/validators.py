@@ -1,10 +1,13 @@
 """
 Input validators for order parameters.
 """
-import re
 from typing import Tuple, Optional
 from config import MAX_ORDER_QUANTITY, MIN_ORDER_QUANTITY
 
+_VALID_SIDES = frozenset(('BUY', 'SELL'))
+_ORDER_TYPES = ('MARKET', 'LIMIT', 'STOP_LOSS', 'TAKE_PROFIT')  # listed in error messages
+_VALID_TYPES = frozenset(_ORDER_TYPES)
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
@@ -28,7 +31,9 @@ def validate_symbol(symbol: str) -> str:
     if not symbol:
         raise ValidationError("Symbol cannot be empty")
     
-    if not re.match(r'^[A-Z0-9]{6,}$', symbol):
+    # Same test as the pattern ^[A-Z0-9]{6,}$ (symbol is already uppercase),
+    # done with str methods instead of the regex engine
+    if len(symbol) < 6 or not (symbol.isascii() and symbol.isalnum()):
         raise ValidationError(
             f"Invalid symbol format: '{symbol}'. Expected format like BTCUSDT"
         )
@@ -51,7 +56,7 @@ def validate_side(side: str) -> str:
     """
     side = side.upper().strip()
     
-    if side not in ['BUY', 'SELL']:
+    if side not in _VALID_SIDES:
         raise ValidationError(
             f"Invalid side: '{side}'. Must be 'BUY' or 'SELL'"
         )
@@ -74,11 +79,10 @@ def validate_order_type(order_type: str) -> str:
     """
     order_type = order_type.upper().strip()
     
-    valid_types = ['MARKET', 'LIMIT', 'STOP_LOSS', 'TAKE_PROFIT']
-    if order_type not in valid_types:
+    if order_type not in _VALID_TYPES:
         raise ValidationError(
             f"Invalid order type: '{order_type}'. "
-            f"Must be one of: {', '.join(valid_types)}"
+            f"Must be one of: {', '.join(_ORDER_TYPES)}"
         )
     
     return order_type